@@ -19,19 +19,19 @@ from pydigi.modems import WEFAX, WEFAX576, WEFAX288
 from pydigi.utils.audio import save_wav
 
 
-def example_1_test_pattern():
+def example_1_test_pattern(wefax):
     """
     Example 1: Transmit WEFAX test pattern (no image file needed)
 
     The transmit_test_pattern() method generates a black/white bar test pattern.
     This is useful for testing without requiring an image file or text input.
+
+    Args:
+        wefax: WEFAX_576 modem instance
     """
     print("Example 1: WEFAX Test Pattern")
     print("-" * 50)
 
-    # Create WEFAX_576 modem
-    wefax = WEFAX576()
-
     # Generate test pattern transmission using transmit_test_pattern()
     audio = wefax.transmit_test_pattern()
 
@@ -49,12 +49,15 @@ def example_1_test_pattern():
     print()
 
 
-def example_2_numpy_array():
+def example_2_numpy_array(wefax):
     """
     Example 2: Transmit image from numpy array
 
     Create a simple gradient image and transmit it.
     No PIL/Pillow required for this example.
+
+    Args:
+        wefax: WEFAX_576 modem instance
     """
     print("Example 2: WEFAX from Numpy Array")
     print("-" * 50)
@@ -69,9 +72,6 @@ def example_2_numpy_array():
     for col in range(width):
         gradient[:, col] = int(255 * col / width)
 
-    # Create WEFAX_576 modem
-    wefax = WEFAX576()
-
     # Transmit the image
     audio = wefax.transmit_image(gradient)
 
@@ -86,12 +86,15 @@ def example_2_numpy_array():
     print()
 
 
-def example_3_image_file():
+def example_3_image_file(wefax):
     """
     Example 3: Transmit image from file
 
     Requires Pillow (PIL) to be installed.
     If you don't have an image file, this will create one.
+
+    Args:
+        wefax: WEFAX_576 modem instance
     """
     print("Example 3: WEFAX from Image File")
     print("-" * 50)
@@ -130,7 +133,6 @@ def example_3_image_file():
         print(f"Created sample image: sample_wefax.png")
 
         # Transmit the image
-        wefax = WEFAX576()
         audio = wefax.transmit_image("sample_wefax.png")
 
         # Save to WAV file
@@ -148,11 +150,15 @@ def example_3_image_file():
         print()
 
 
-def example_4_both_modes():
+def example_4_both_modes(wefax576, wefax288):
     """
     Example 4: Compare WEFAX_576 and WEFAX_288 modes
 
     Shows the difference between the two WEFAX modes.
+
+    Args:
+        wefax576: WEFAX_576 modem instance
+        wefax288: WEFAX_288 modem instance
     """
     print("Example 4: WEFAX_576 vs WEFAX_288")
     print("-" * 50)
@@ -171,7 +177,6 @@ def example_4_both_modes():
 
     # WEFAX_576 transmission
     print("WEFAX_576 mode:")
-    wefax576 = WEFAX576()
     audio576 = wefax576.transmit_image(checkerboard)
     save_wav("wefax_576_checkerboard.wav", audio576, wefax576.sample_rate)
     duration576 = len(audio576) / wefax576.sample_rate
@@ -185,7 +190,6 @@ def example_4_both_modes():
 
     # WEFAX_288 transmission
     print("WEFAX_288 mode:")
-    wefax288 = WEFAX288()
     audio288 = wefax288.transmit_image(checkerboard)
     save_wav("wefax_288_checkerboard.wav", audio288, wefax288.sample_rate)
     duration288 = len(audio288) / wefax288.sample_rate
@@ -198,11 +202,14 @@ def example_4_both_modes():
     print()
 
 
-def example_5_custom_lpm():
+def example_5_custom_lpm(wefax):
     """
     Example 5: Custom LPM (Lines Per Minute) setting
 
     Shows how to override the default LPM to speed up or slow down transmission.
+
+    Args:
+        wefax: WEFAX_576 modem instance
     """
     print("Example 5: Custom LPM Settings")
     print("-" * 50)
@@ -217,8 +224,6 @@ def example_5_custom_lpm():
         if (y // 10) % 2 == 0:
             stripes[y, :] = 255
 
-    wefax = WEFAX576()
-
     # Default LPM (120)
     print(f"Default LPM: {wefax.default_lpm}")
     audio_default = wefax.transmit_image(stripes)
@@ -247,11 +252,14 @@ def example_5_custom_lpm():
     print()
 
 
-def example_6_partial_transmission():
+def example_6_partial_transmission(wefax):
     """
     Example 6: Partial transmission (disable APT/phasing/black)
 
     Shows how to transmit just the image data without APT tones and phasing.
+
+    Args:
+        wefax: WEFAX_576 modem instance
     """
     print("Example 6: Partial Transmission Options")
     print("-" * 50)
@@ -269,8 +277,6 @@ def example_6_partial_transmission():
             distance = np.sqrt((x - center_x) ** 2 + (y - center_y) ** 2)
             circle_pattern[y, x] = int((np.sin(distance / 20) + 1) * 127.5)
 
-    wefax = WEFAX576()
-
     # Full transmission (default)
     print("Full transmission (with all components):")
     audio_full = wefax.transmit_image(circle_pattern)
@@ -296,18 +302,21 @@ def example_6_partial_transmission():
     print()
 
 
-def example_7_text_transmission():
+def example_7_text_transmission(wefax, wefax288):
     """
     Example 7: Transmit text rendered as image
 
     Shows how to use tx_process() and modulate() to transmit text.
     Text is rendered as monospace on letter-sized pages with 1" margins.
+
+    Args:
+        wefax: WEFAX_576 modem instance
+        wefax288: WEFAX_288 modem instance
     """
     print("Example 7: WEFAX Text Transmission")
     print("-" * 50)
 
     # Short text (single page)
-    wefax = WEFAX576()
     text = """WEATHER REPORT
 
 Temperature: 20°C
@@ -330,12 +339,9 @@ Winds increasing to 25kt"""
 
     # Long text (multi-page)
     print("Transmitting long weather bulletin (multi-page)...")
-    long_text = "WEATHER BULLETIN\n\n" + "\n".join(
-        [
-            f"Hour {i:02d}: Temperature {20+i%10}°C, Wind {10+i%15}kt, Pressure {1010+i%20} hPa"
-            for i in range(100)
-        ]
-    )
+    line_template = "Hour %02d: Temperature %d°C, Wind %dkt, Pressure %d hPa"
+    lines = [line_template % (i, 20 + i % 10, 10 + i % 15, 1010 + i % 20) for i in range(100)]
+    long_text = "WEATHER BULLETIN\n\n" + "\n".join(lines)
 
     audio_long = wefax.modulate(long_text)
     save_wav("wefax_text_long.wav", audio_long, wefax.sample_rate)
@@ -347,7 +353,6 @@ Winds increasing to 25kt"""
 
     # WEFAX_288 mode (lower resolution, faster)
     print("Transmitting with WEFAX_288 mode (lower resolution)...")
-    wefax288 = WEFAX288()
     text_288 = """WEFAX_288 MODE TEST
 
 This is transmitted using
@@ -367,20 +372,20 @@ Image width: 904 pixels
     print()
 
 
-def example_8_markdown_transmission():
+def example_8_markdown_transmission(wefax):
     """
     Example 8: Transmit markdown-formatted text
 
     Shows how to use markdown formatting for rich text rendering.
     Requires Pillow to be installed.
+
+    Args:
+        wefax: WEFAX_576 modem instance created with text_markdown=True
     """
     print("Example 8: WEFAX Markdown Transmission")
     print("-" * 50)
 
     try:
-        # Create WEFAX modem with markdown enabled
-        wefax = WEFAX576(text_markdown=True)
-
         # Markdown text with various formatting
         markdown_text = """# Weather Report
 ## Marine Forecast for Region 7
@@ -473,11 +478,10 @@ For updates, contact marine weather service.
 End of document.
 """
 
-        wefax_short = WEFAX576(text_markdown=True)
-        audio_short = wefax_short.modulate(short_markdown)
-        save_wav("wefax_markdown_short.wav", audio_short, wefax_short.sample_rate)
+        audio_short = wefax.modulate(short_markdown)
+        save_wav("wefax_markdown_short.wav", audio_short, wefax.sample_rate)
 
-        duration_short = len(audio_short) / wefax_short.sample_rate
+        duration_short = len(audio_short) / wefax.sample_rate
         print(f"  Duration: {duration_short:.1f} seconds")
         print(f"  Saved to: wefax_markdown_short.wav")
         print()
@@ -496,15 +500,20 @@ def main():
     print("=" * 50)
     print()
 
+    # Create each modem once and share it across the examples
+    wefax576 = WEFAX576()
+    wefax288 = WEFAX288()
+    wefax_markdown = WEFAX576(text_markdown=True)
+
     # Run all examples
-    example_1_test_pattern()
-    example_2_numpy_array()
-    example_3_image_file()
-    example_4_both_modes()
-    example_5_custom_lpm()
-    example_6_partial_transmission()
-    example_7_text_transmission()
-    example_8_markdown_transmission()
+    example_1_test_pattern(wefax576)
+    example_2_numpy_array(wefax576)
+    example_3_image_file(wefax576)
+    example_4_both_modes(wefax576, wefax288)
+    example_5_custom_lpm(wefax576)
+    example_6_partial_transmission(wefax576)
+    example_7_text_transmission(wefax576, wefax288)
+    example_8_markdown_transmission(wefax_markdown)
 
     print("=" * 50)
     print("All examples completed!")
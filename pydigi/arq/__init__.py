@@ -1,6 +1,6 @@
 """FLARQ ARQ Protocol implementation for pydigi."""
 
-from .crc import CRC16
+from .crc import CRC16, crc16_modbus, crc16_modbus_hex, crc16_modbus_many
 from .frame import ARQFrame
 from .blocks import BlockTracker
 from .config import ARQConfig
@@ -18,6 +18,9 @@ from .exceptions import (
 
 __all__ = [
     'CRC16',
+    'crc16_modbus',
+    'crc16_modbus_hex',
+    'crc16_modbus_many',
     'ARQFrame',
     'BlockTracker',
     'ARQConfig',
@@ -5,24 +5,45 @@ Handles modulo-64 block numbering, missing block detection,
 and out-of-order block queuing.
 """
 
-from typing import List, Optional, Tuple
-from dataclasses import dataclass
+from typing import List, NamedTuple, Optional, Tuple
 
 
 # Constants
 MAXCOUNT = 64  # Block numbers wrap at 64
+BLOCK_MASK = MAXCOUNT - 1  # x % MAXCOUNT == x & BLOCK_MASK, without a division
 
 
-@dataclass
-class Block:
-    """Represents a data block with number and payload."""
+class Block(NamedTuple):
+    """Represents a data block with number and payload.
+
+    The block number is not validated here; BlockTracker.receive_block()
+    range-checks it before any Block is constructed.
+    """
     number: int  # Block number (0-63)
     payload: str  # Block payload content
 
-    def __post_init__(self):
-        """Validate block number is in valid range."""
-        if not (0 <= self.number < MAXCOUNT):
-            raise ValueError(f"Block number must be 0-{MAXCOUNT-1}, got {self.number}")
+
+class TxBlock:
+    """A data block queued for transmission.
+
+    Unlike Block this is mutable: the built frame is attached after the
+    first send so retransmissions reuse it.
+    """
+
+    # Attribute access in the TX loop instead of string-keyed dict lookups
+    __slots__ = ('block_num', 'text', 'frame_bytes')
+
+    def __init__(self, block_num: int, text: str):
+        """
+        Initialize a transmit block.
+
+        Args:
+            block_num: Block number (0-63)
+            text: Block payload text
+        """
+        self.block_num = block_num
+        self.text = text
+        self.frame_bytes: Optional[bytes] = None  # Built frame, once sent
 
 
 class BlockTracker:
@@ -43,8 +64,10 @@ class BlockTracker:
         self.last_sent: int = MAXCOUNT - 1    # Last block sent
         self.last_queued: int = MAXCOUNT - 1  # Last block queued for sending
 
-        # Pending blocks (received out of order)
+        # Pending blocks (received out of order), kept sorted relative to
+        # _pending_base (the good_header they were last ordered against)
         self.rx_pending: List[Block] = []
+        self._pending_base: int = self.good_header
 
     def next_block_number(self) -> int:
         """
@@ -53,7 +76,7 @@ class BlockTracker:
         Returns:
             Next block number (0-63)
         """
-        self.last_queued = (self.last_queued + 1) % MAXCOUNT
+        self.last_queued = (self.last_queued + 1) & BLOCK_MASK
         return self.last_queued
 
     def receive_block(self, block_number: int, payload: str) -> Tuple[List[str], bool]:
@@ -76,7 +99,7 @@ class BlockTracker:
         self.end_header = block_number
 
         # Check if this block is consecutive
-        expected_next = (self.good_header + 1) % MAXCOUNT
+        expected_next = (self.good_header + 1) & BLOCK_MASK
 
         if block_number == expected_next:
             # Consecutive block - can process immediately
@@ -88,30 +111,39 @@ class BlockTracker:
 
             return consecutive_payloads, True
         else:
-            # Out of order - add to pending
-            block = Block(number=block_number, payload=payload)
-            self.rx_pending.append(block)
-
-            # Sort pending blocks
-            self._sort_pending()
+            # Out of order - add to pending, keeping it sorted
+            self._insert_pending(Block(number=block_number, payload=payload))
 
             return [], False
 
-    def _sort_pending(self):
-        """Sort pending blocks accounting for modulo-64 wrapping."""
-        if not self.rx_pending:
-            return
+    def _insert_pending(self, block: Block):
+        """
+        Insert a block into the sorted pending list.
 
-        # Sort using comparison that accounts for wrapping
-        # Blocks are sorted relative to good_header
-        def block_key(block: Block) -> int:
-            n = block.number
-            # Adjust blocks below good_header (they wrapped around)
-            if n < self.good_header:
-                n += MAXCOUNT
-            return n
+        Pending blocks are ordered by their distance past good_header, which
+        accounts for modulo-64 wrapping. While good_header stays put the list
+        is already in order, so the new block is placed by binary search
+        after any equal keys instead of re-sorting. Only when good_header has
+        moved since the last insert is the list re-sorted first.
 
-        self.rx_pending.sort(key=block_key)
+        Args:
+            block: Out-of-order block to hold
+        """
+        pending = self.rx_pending
+        good_header = self.good_header
+        if good_header != self._pending_base:
+            pending.sort(key=lambda b: (b.number - good_header) & BLOCK_MASK)
+            self._pending_base = good_header
+        key = (block.number - good_header) & BLOCK_MASK
+
+        lo, hi = 0, len(pending)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if (pending[mid].number - good_header) & BLOCK_MASK <= key:
+                lo = mid + 1
+            else:
+                hi = mid
+        pending.insert(lo, block)
 
     def _process_pending(self) -> List[str]:
         """
@@ -121,19 +153,27 @@ class BlockTracker:
             List of consecutive payloads from pending queue
         """
         consecutive = []
+        pending = self.rx_pending
+        good_header = self.good_header
 
-        while self.rx_pending:
-            expected_next = (self.good_header + 1) % MAXCOUNT
+        # Walk the consecutive run at the front, then drop it in one slice
+        # rather than shifting the list down with a pop(0) per block
+        count = 0
+        while count < len(pending):
+            block = pending[count]
 
-            # Check if first pending block is consecutive
-            if self.rx_pending[0].number == expected_next:
-                block = self.rx_pending.pop(0)
-                self.good_header = block.number
-                consecutive.append(block.payload)
-            else:
+            # Check if this pending block is consecutive
+            if block.number != (good_header + 1) & BLOCK_MASK:
                 # No more consecutive blocks
                 break
 
+            good_header = block.number
+            consecutive.append(block.payload)
+            count += 1
+
+        del pending[:count]
+        self.good_header = good_header
+
         return consecutive
 
     def get_missing_blocks(self) -> List[int]:
@@ -147,9 +187,10 @@ class BlockTracker:
             return []
 
         missing = []
+        pending = {b.number for b in self.rx_pending}
 
         # Range to check: (good_header + 1) to end_header (inclusive)
-        start = (self.good_header + 1) % MAXCOUNT
+        start = (self.good_header + 1) & BLOCK_MASK
         end = self.end_header
 
         # Handle wrapping
@@ -158,21 +199,18 @@ class BlockTracker:
 
         # Check each block in range
         current = start
-        while current != (end % MAXCOUNT):
-            test_block = current % MAXCOUNT
+        while current != (end & BLOCK_MASK):
+            test_block = current & BLOCK_MASK
 
             # Check if this block is in pending
-            is_pending = any(b.number == test_block for b in self.rx_pending)
-
-            if not is_pending:
+            if test_block not in pending:
                 missing.append(test_block)
 
             current += 1
 
         # Check end block itself
-        test_block = end % MAXCOUNT
-        is_pending = any(b.number == test_block for b in self.rx_pending)
-        if not is_pending and test_block != self.good_header:
+        test_block = end & BLOCK_MASK
+        if test_block not in pending and test_block != self.good_header:
             missing.append(test_block)
 
         return missing
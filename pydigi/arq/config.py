@@ -3,6 +3,25 @@
 from dataclasses import dataclass, field
 from typing import Optional
 
+# Numeric field limits checked by ARQConfig.__post_init__:
+# (field, minimum, maximum or None, error message)
+_FIELD_LIMITS = (
+    ('max_block_count', 64, 64, "max_block_count must be 64 (protocol requirement)"),
+    ('exponent', 4, 8, "exponent must be between 4 and 8"),
+    ('max_headers', 1, 64, "max_headers must be between 1 and 64"),
+    ('retry_time', 100, None, "retry_time must be at least 100ms"),
+    ('retries', 1, None, "retries must be at least 1"),
+)
+
+# Fields that buffer_length and max_payload_size are derived from
+_SIZE_FIELDS = ('exponent', 'custom_buffer_length')
+
+# Fields that the loop-iteration tick counts are derived from
+_TICK_FIELDS = ('loop_time', 'retry_time', 'tx_delay', 'timeout')
+
+# Default keepalive ID interval in minutes
+DEFAULT_ID_MINUTES = 10
+
 
 @dataclass
 class ARQConfig:
@@ -38,20 +57,10 @@ class ARQConfig:
 
     def __post_init__(self):
         """Validate configuration parameters."""
-        if self.max_block_count != 64:
-            raise ValueError("max_block_count must be 64 (protocol requirement)")
-
-        if self.exponent < 4 or self.exponent > 8:
-            raise ValueError("exponent must be between 4 and 8")
-
-        if self.max_headers < 1 or self.max_headers > 64:
-            raise ValueError("max_headers must be between 1 and 64")
-
-        if self.retry_time < 100:
-            raise ValueError("retry_time must be at least 100ms")
-
-        if self.retries < 1:
-            raise ValueError("retries must be at least 1")
+        for name, low, high, message in _FIELD_LIMITS:
+            value = getattr(self, name)
+            if value < low or (high is not None and value > high):
+                raise ValueError(message)
 
         if self.timeout < self.retry_time:
             raise ValueError("timeout must be >= retry_time")
@@ -61,6 +70,49 @@ class ARQConfig:
                 (self.my_stream_id.isdigit() and 0 <= int(self.my_stream_id) <= 63)):
             raise ValueError("my_stream_id must be '0' or '1'-'63'")
 
+        self._update_sizes()
+        self._update_ticks()
+
+    def __setattr__(self, name, value):
+        """Set a field, keeping the cached derived values in step with it."""
+        object.__setattr__(self, name, value)
+        if name in _SIZE_FIELDS and '_buffer_length' in self.__dict__:
+            self._update_sizes()
+        elif name in _TICK_FIELDS and '_timeout_ticks' in self.__dict__:
+            self._update_ticks()
+
+    def _update_sizes(self) -> None:
+        """Recompute the derived buffer sizes read by the protocol loop."""
+        if self.custom_buffer_length is not None:
+            buffer_length = self.custom_buffer_length
+        else:
+            buffer_length = 1 << self.exponent
+        self._buffer_length = buffer_length
+        # FLARQ supports payloads up to buffer_length
+        # but typically uses smaller chunks
+        self._max_payload_size = min(512, buffer_length)
+
+    def _update_ticks(self) -> None:
+        """Recompute the timer lengths in loop iterations."""
+        loop_time = self.loop_time
+        self._retry_ticks = self.retry_time // loop_time
+        self._tx_delay_ticks = self.tx_delay // loop_time
+        self._timeout_ticks = self.timeout // loop_time
+        self._id_ticks = self.id_ticks_for(DEFAULT_ID_MINUTES)
+
+    def id_ticks_for(self, minutes: int) -> int:
+        """Convert a keepalive ID interval to loop iterations.
+
+        The ID goes out 10 seconds before the interval ends.
+
+        Args:
+            minutes: Minutes until the next ID frame
+
+        Returns:
+            Interval in loop iterations
+        """
+        return ((minutes * 60 - 10) * 1000) // self.loop_time
+
     @property
     def buffer_length(self) -> int:
         """Calculate buffer length from exponent.
@@ -68,9 +120,7 @@ class ARQConfig:
         Returns:
             Buffer length = 2^exponent
         """
-        if self.custom_buffer_length is not None:
-            return self.custom_buffer_length
-        return 2 ** self.exponent
+        return self._buffer_length
 
     @property
     def max_payload_size(self) -> int:
@@ -79,6 +129,24 @@ class ARQConfig:
         Returns:
             Maximum payload size (512 bytes for default exponent=7)
         """
-        # FLARQ supports payloads up to buffer_length
-        # but typically uses smaller chunks
-        return min(512, self.buffer_length)
+        return self._max_payload_size
+
+    @property
+    def retry_ticks(self) -> int:
+        """retry_time in loop iterations."""
+        return self._retry_ticks
+
+    @property
+    def tx_delay_ticks(self) -> int:
+        """tx_delay in loop iterations."""
+        return self._tx_delay_ticks
+
+    @property
+    def timeout_ticks(self) -> int:
+        """timeout in loop iterations."""
+        return self._timeout_ticks
+
+    @property
+    def id_ticks(self) -> int:
+        """Default keepalive ID interval in loop iterations."""
+        return self._id_ticks
@@ -3,13 +3,192 @@
 Uses standard CRC-16-MODBUS algorithm (polynomial 0xA001, init 0xFFFF)
 which matches fldigi's implementation exactly.
 """
-import crcmod
+import sys
+from array import array
+from functools import lru_cache
+from typing import List, Sequence, Union
+
+
+def _make_table(poly: int) -> array:
+    """
+    Build the 256-entry lookup table for a reflected CRC-16.
+
+    Args:
+        poly: Reflected generator polynomial (0xA001 for MODBUS)
+
+    Returns:
+        array('H') of per-byte CRC contributions
+    """
+    table = array('H')
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ poly if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_MODBUS_TABLE = _make_table(0xA001)
+
+# Two-bytes-per-step table. Once a little-endian 16-bit word has been XORed
+# into the register, the next register is _MODBUS_TABLE2[low] ^ _MODBUS_TABLE[high].
+# Halving the loop trip count is what matters for an interpreter-bound loop.
+_MODBUS_TABLE2 = array('H', ((t >> 8) ^ _MODBUS_TABLE[t & 0xFF] for t in _MODBUS_TABLE))
+
+# Below this length the memoryview setup costs more than the saved iterations
+_WORD_LOOP_MIN = 32
+_WORD_LOOP = sys.byteorder == 'little'
+
+# Buffers this long are folded a whole block at a time in NumPy. NumPy is
+# imported on first use so that importing pydigi.arq stays cheap.
+_FOLD_BLOCK = 64
+_FOLD_MIN = 128
+
+
+@lru_cache(maxsize=1)
+def _fold_tables():
+    """
+    Build the per-offset tables used to fold whole blocks.
+
+    CRC is linear over GF(2), so the register after a block (starting from
+    zero) is the XOR of each byte's contribution at its offset. Row i holds
+    that contribution for every byte value at offset i of a _FOLD_BLOCK-byte
+    block - the lookup-table counterpart of carry-less-multiply folding.
+
+    Returns:
+        Tuple of (rows, offsets, carry_lo, carry_hi): the rows flattened so a
+        byte at offset i is looked up at rows[offsets[i] + byte], and rows 0
+        and 1 as lists. Carrying the register into a block is the same as
+        XORing it into the block's first two bytes.
+    """
+    import numpy as np
+
+    table = np.array(_MODBUS_TABLE, dtype=np.uint16)
+    rows = np.empty((_FOLD_BLOCK, 256), dtype=np.uint16)
+    rows[-1] = table
+    for i in range(_FOLD_BLOCK - 2, -1, -1):
+        following = rows[i + 1]
+        rows[i] = (following >> 8) ^ table[following & 0xFF]
+    rows = rows.ravel()
+    rows.flags.writeable = False
+    offsets = np.arange(0, _FOLD_BLOCK * 256, 256)
+    return rows, offsets, rows[:256].tolist(), rows[256:512].tolist()
+
+
+def _crc16_fold(data, crc: int) -> int:
+    """
+    CRC-16-MODBUS over a long buffer, _FOLD_BLOCK bytes per step.
+
+    Args:
+        data: bytes-like object of at least _FOLD_BLOCK bytes
+        crc: Starting register value
+
+    Returns:
+        CRC value as 16-bit integer
+    """
+    import numpy as np
+
+    rows, offsets, carry_lo, carry_hi = _fold_tables()
+    n_blocks = len(data) // _FOLD_BLOCK
+    blocks = np.frombuffer(data, dtype=np.uint8, count=n_blocks * _FOLD_BLOCK)
+    parts = np.bitwise_xor.reduce(rows[blocks.reshape(n_blocks, _FOLD_BLOCK) + offsets], axis=1)
+    for part in parts.tolist():
+        crc = carry_lo[crc & 0xFF] ^ carry_hi[crc >> 8] ^ part
+    return crc16_modbus(memoryview(data)[n_blocks * _FOLD_BLOCK:], crc)
+
+
+def crc16_modbus(data, crc: int = 0xFFFF) -> int:
+    """
+    Calculate the CRC-16-MODBUS of a bytes-like object.
+
+    Args:
+        data: bytes, bytearray or memoryview to process
+        crc: Starting register value (0xFFFF for a fresh CRC)
+
+    Returns:
+        CRC value as 16-bit integer
+    """
+    n = len(data)
+    if n >= _FOLD_MIN:
+        return _crc16_fold(data, crc)
+    table = _MODBUS_TABLE
+    if n >= _WORD_LOOP_MIN and _WORD_LOOP:
+        table2 = _MODBUS_TABLE2
+        for w in memoryview(data)[:n & ~1].cast('H'):
+            x = crc ^ w
+            crc = table2[x & 0xFF] ^ table[x >> 8]
+        if n & 1:
+            crc = (crc >> 8) ^ table[(crc ^ data[-1]) & 0xFF]
+        return crc
+    for b in data:
+        crc = (crc >> 8) ^ table[(crc ^ b) & 0xFF]
+    return crc
+
+
+def crc16_modbus_hex(data) -> bytes:
+    """
+    Calculate the CRC-16-MODBUS of a bytes-like object as frame-ready ASCII.
+
+    Args:
+        data: bytes, bytearray or memoryview to process
+
+    Returns:
+        4 uppercase hex digits as bytes, e.g. b"A3F1"
+    """
+    return b"%04X" % crc16_modbus(data)
+
+
+def crc16_modbus_many(buffers: Sequence[bytes]) -> List[int]:
+    """
+    CRC-16-MODBUS of several buffers in one NumPy pass.
+
+    Buffers are right-aligned in a zero-padded matrix: leading zero bytes
+    leave a zero register unchanged, and the 0xFFFF start value is folded
+    in by XORing it into each buffer's first two bytes. All buffers are then
+    folded block by block together.
+
+    Args:
+        buffers: bytes-like objects (e.g. frames awaiting retransmission)
+
+    Returns:
+        List of CRC values, one per buffer
+    """
+    lengths = [len(b) for b in buffers]
+    if not buffers or min(lengths) < 2:
+        # The two-byte seeding trick needs at least two bytes per buffer
+        return [crc16_modbus(b) for b in buffers]
+
+    import numpy as np
+
+    rows, offsets, _, _ = _fold_tables()
+    count = len(buffers)
+    n_blocks = -(-max(lengths) // _FOLD_BLOCK)
+    width = n_blocks * _FOLD_BLOCK
+    zeros = memoryview(bytes(width))
+    padded = np.frombuffer(
+        bytearray().join([part for b in buffers for part in (zeros[len(b):], b)]),
+        dtype=np.uint8,
+    )
+    starts = np.arange(0, count * width, width) + (width - np.array(lengths))
+    padded[starts] ^= 0xFF
+    padded[starts + 1] ^= 0xFF
+
+    indices = padded.reshape(count, n_blocks, _FOLD_BLOCK) + offsets
+    parts = np.bitwise_xor.reduce(rows[indices], axis=2)
+    crc = parts[:, 0]
+    carry_lo, carry_hi = rows[:256], rows[256:512]
+    for j in range(1, n_blocks):
+        crc = carry_lo[crc & 0xFF] ^ carry_hi[crc >> 8] ^ parts[:, j]
+    return crc.tolist()
 
 
 class CRC16:
     """
     CRC-16-MODBUS calculator matching fldigi's implementation.
 
+    Kept for incremental (byte-at-a-time) use and backward compatibility;
+    one-shot callers should use crc16_modbus() / crc16_modbus_hex().
+
     fldigi uses CRC-16 with polynomial 0xA001 and init 0xFFFF,
     which is the standard CRC-16-MODBUS algorithm.
 
@@ -18,12 +197,11 @@ class CRC16:
 
     def __init__(self):
         """Initialize CRC calculator."""
-        self._crc_func = crcmod.predefined.mkCrcFun('modbus')
-        self._buffer = bytearray()
+        self._state = 0xFFFF
 
     def reset(self):
         """Reset CRC calculation."""
-        self._buffer = bytearray()
+        self._state = 0xFFFF
 
     def update(self, byte: int):
         """
@@ -32,7 +210,8 @@ class CRC16:
         Args:
             byte: Integer 0-255 to process
         """
-        self._buffer.append(byte & 0xFF)
+        state = self._state
+        self._state = (state >> 8) ^ _MODBUS_TABLE[(state ^ byte) & 0xFF]
 
     def value(self) -> int:
         """
@@ -41,7 +220,7 @@ class CRC16:
         Returns:
             CRC value as 16-bit integer
         """
-        return self._crc_func(bytes(self._buffer))
+        return self._state
 
     def hex_string(self) -> str:
         """
@@ -50,9 +229,10 @@ class CRC16:
         Returns:
             String like "A3F1", "12EF", etc.
         """
-        return f"{self.value():04X}"
+        return self._state.to_bytes(2, 'big').hex().upper()
 
-    def calculate(self, data: str | bytes) -> str:
+    @staticmethod
+    def calculate(data: Union[str, bytes]) -> str:
         """
         Calculate CRC for data and return hex string.
 
@@ -64,4 +244,19 @@ class CRC16:
         """
         if isinstance(data, str):
             data = data.encode('latin-1')
-        return f"{self._crc_func(data):04X}"
+        return crc16_modbus(data).to_bytes(2, 'big').hex().upper()
+
+    @staticmethod
+    def calculate_int(data: Union[str, bytes]) -> int:
+        """
+        Calculate CRC for data and return it as an integer.
+
+        Args:
+            data: String or bytes to calculate CRC for
+
+        Returns:
+            CRC value as 16-bit integer
+        """
+        if isinstance(data, str):
+            data = data.encode('latin-1')
+        return crc16_modbus(data)
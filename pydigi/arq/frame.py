@@ -1,6 +1,8 @@
 """ARQ Frame building and parsing."""
 
-from .crc import CRC16
+from typing import Callable, List, Sequence, Tuple, Union
+
+from .crc import crc16_modbus, crc16_modbus_hex, crc16_modbus_many
 
 # Control characters (from fldigi arq.h)
 SOH = 0x01  # Start of Header
@@ -24,10 +26,36 @@ DISACK = ord('b')    # 0x62 - Disconnect acknowledge
 UNPROTO = ord('u')   # 0x75 - Unprotocolled
 TALK = ord('t')      # 0x74 - Keyboard text
 
+# Human-readable names for control block types (used by __repr__)
+_BLOCK_TYPE_NAMES = {
+    CONREQ: 'CONREQ',
+    CONACK: 'CONACK',
+    STATUS: 'STATUS',
+    DISREQ: 'DISREQ',
+    DISACK: 'DISACK',
+    IDENT: 'IDENT',
+    POLL: 'POLL',
+    ABORT: 'ABORT',
+    ACKABORT: 'ACKABORT',
+    UNPROTO: 'UNPROTO',
+    TALK: 'TALK',
+}
+
 # Data block encoding
 # Block numbers 0-63 are encoded as block_num + 0x20 (0x20-0x3F)
 DATA_BLOCK_OFFSET = 0x20
 
+# Per block type lookups for build(): the header character (data blocks are
+# offset into 0x20-0x5F) and the terminator (SOH for data, EOT for control)
+_BLOCK_TYPE_CHARS = bytes(i + DATA_BLOCK_OFFSET if i < 64 else i for i in range(256))
+_TERMINATORS = bytes([SOH] * 64 + [EOT] * 192)
+
+# Header byte -> one-character str for parse(), in place of a chr() call per field
+_BYTE_CHARS = tuple(map(chr, range(256)))
+
+# The only bytes a CRC field may hold: uppercase hex digits, as build() writes
+_CRC_DIGITS = b"0123456789ABCDEF"
+
 
 class ARQFrame:
     """
@@ -36,12 +64,15 @@ class ARQFrame:
     Frame structure: <SOH>[Header(4)][Payload(0-512)][CRC(4)]<EOT|SOH>
     """
 
+    # Frames can pile up in retransmit queues; skip the per-instance __dict__
+    __slots__ = ('protocol_version', 'stream_id', 'block_type', 'payload')
+
     def __init__(
         self,
         protocol_version: str = '0',
         stream_id: str = '0',
         block_type: int = None,
-        payload: str = ''
+        payload: Union[str, bytes] = b''
     ):
         """
         Initialize ARQ frame.
@@ -50,12 +81,18 @@ class ARQFrame:
             protocol_version: Protocol version character (default '0')
             stream_id: Stream ID character '0'-'9', 'A'-'Z' (default '0')
             block_type: Block type (int): CONREQ, STATUS, or block_num for data
-            payload: Frame payload (0-512 chars)
+            payload: Frame payload (0-512 bytes); str is encoded as latin-1
+
+        Raises:
+            ValueError: If block_type is not an int in 0-255
         """
+        if not isinstance(block_type, int) or not 0 <= block_type <= 0xFF:
+            raise ValueError(f"Invalid block_type: {block_type}")
+
         self.protocol_version = protocol_version
         self.stream_id = stream_id
         self.block_type = block_type
-        self.payload = payload
+        self.payload = payload.encode('latin-1') if isinstance(payload, str) else bytes(payload)
 
     def build(self) -> bytes:
         """
@@ -64,35 +101,91 @@ class ARQFrame:
         Returns:
             Complete frame as bytes, ready for modulation
         """
-        # Build header: SOH + version + stream_id + block_type_char
-        header = chr(SOH) + self.protocol_version + self.stream_id
-
-        # Encode block type
-        if isinstance(self.block_type, int):
-            if self.block_type < 64:  # Data block (0-63)
-                header += chr(self.block_type + DATA_BLOCK_OFFSET)
-            else:  # Control block type
-                header += chr(self.block_type)
-        else:
-            raise ValueError(f"Invalid block_type: {self.block_type}")
-
-        # Build frame without CRC and terminator
-        frame_without_crc = header + self.payload
+        block_type = self.block_type
+        payload = self.payload
+
+        # Layout: SOH + version + stream_id + block_type_char + payload + CRC(4) + terminator
+        end = 4 + len(payload)
+        buf = bytearray(end + 5)
+        buf[0] = SOH
+        buf[1] = ord(self.protocol_version)
+        buf[2] = ord(self.stream_id)
+        buf[3] = _BLOCK_TYPE_CHARS[block_type]
+        buf[4:end] = payload
 
         # Calculate CRC over SOH through last payload byte
-        crc = CRC16()
-        crc_value = crc.calculate(frame_without_crc)
+        buf[end:end + 4] = crc16_modbus_hex(memoryview(buf)[:end])
+        buf[-1] = _TERMINATORS[block_type]
 
-        # Determine terminator (data blocks use SOH, control use EOT)
-        if self.block_type < 64:  # Data block
-            terminator = chr(SOH)
-        else:  # Control block
-            terminator = chr(EOT)
+        return bytes(buf)
 
-        # Complete frame
-        complete_frame = frame_without_crc + crc_value + terminator
+    @staticmethod
+    def make_builder(
+        protocol_version: str = '0',
+        stream_id: str = '0'
+    ) -> Callable[[int, Union[str, bytes]], bytes]:
+        """
+        Make a data-frame builder for a fixed protocol version and stream.
 
-        return complete_frame.encode('latin-1')
+        Within a session every data frame shares its first three header
+        bytes, so the builder starts each frame from a prebuilt header and
+        skips the block type dispatch in build().
+
+        Args:
+            protocol_version: Protocol version character (default '0')
+            stream_id: Stream ID character (default '0')
+
+        Returns:
+            Function taking (block_num, payload) and returning the same bytes
+            as ARQFrame(protocol_version, stream_id, block_num, payload).build()
+        """
+        header = bytes((SOH, ord(protocol_version), ord(stream_id)))
+
+        def build_data_frame(block_num: int, payload: Union[str, bytes]) -> bytes:
+            if isinstance(payload, str):
+                payload = payload.encode('latin-1')
+            buf = bytearray(header)
+            buf.append(block_num + DATA_BLOCK_OFFSET)
+            buf += payload
+            buf += crc16_modbus_hex(buf)
+            buf.append(SOH)
+            return bytes(buf)
+
+        return build_data_frame
+
+    @staticmethod
+    def make_batch_builder(
+        protocol_version: str = '0',
+        stream_id: str = '0'
+    ) -> Callable[[Sequence[Tuple[int, Union[str, bytes]]]], List[bytes]]:
+        """
+        Make a builder that emits several data frames with one batched CRC pass.
+
+        Args:
+            protocol_version: Protocol version character (default '0')
+            stream_id: Stream ID character (default '0')
+
+        Returns:
+            Function taking a sequence of (block_num, payload) pairs and
+            returning the frames make_builder() would build for them
+        """
+        header = bytes((SOH, ord(protocol_version), ord(stream_id)))
+
+        def build_data_frames(blocks: Sequence[Tuple[int, Union[str, bytes]]]) -> List[bytes]:
+            frames = []
+            for block_num, payload in blocks:
+                if isinstance(payload, str):
+                    payload = payload.encode('latin-1')
+                buf = bytearray(header)
+                buf.append(block_num + DATA_BLOCK_OFFSET)
+                buf += payload
+                frames.append(buf)
+            for buf, crc in zip(frames, crc16_modbus_many(frames)):
+                buf += b"%04X" % crc
+                buf.append(SOH)
+            return [bytes(buf) for buf in frames]
+
+        return build_data_frames
 
     @staticmethod
     def parse(frame_bytes: bytes) -> 'ARQFrame':
@@ -108,57 +201,52 @@ class ARQFrame:
         Raises:
             ValueError: If frame format invalid or CRC mismatch
         """
-        # Decode from latin-1 (preserves all byte values)
-        try:
-            frame = frame_bytes.decode('latin-1')
-        except UnicodeDecodeError as e:
-            raise ValueError(f"Frame decode error: {e}")
+        # Work on the raw bytes; every field is a byte or a byte range
+        frame = memoryview(frame_bytes)
 
         # Minimum frame: SOH + 3 header bytes + 4 CRC + terminator = 9 bytes
         if len(frame) < 9:
             raise ValueError(f"Frame too short: {len(frame)} bytes")
 
         # Verify SOH at start
-        if ord(frame[0]) != SOH:
-            raise ValueError(f"Missing SOH, got: 0x{ord(frame[0]):02X}")
+        if frame[0] != SOH:
+            raise ValueError(f"Missing SOH, got: 0x{frame[0]:02X}")
 
         # Verify terminator (EOT or SOH)
-        terminator = ord(frame[-1])
+        terminator = frame[-1]
         if terminator not in (EOT, SOH):
             raise ValueError(f"Invalid terminator: 0x{terminator:02X}")
 
         # Extract header components
-        protocol_version = frame[1]
-        stream_id = frame[2]
-        block_type_char = ord(frame[3])
-
-        # Extract CRC (last 4 chars before terminator)
-        received_crc = frame[-5:-1]
-
-        # Frame data is everything except CRC and terminator
-        frame_data = frame[:-5]
-
-        # Calculate expected CRC
-        crc = CRC16()
-        calculated_crc = crc.calculate(frame_data)
+        protocol_version = _BYTE_CHARS[frame[1]]
+        stream_id = _BYTE_CHARS[frame[2]]
+        block_type_char = frame[3]
+
+        # Extract CRC (last 4 hex digits before terminator) and compare as
+        # integers; hex formatting is only needed for the error message.
+        # Anything but four uppercase hex digits (lowercase, a 0x prefix,
+        # whitespace or a sign, all of which int() accepts) is a mismatch.
+        crc_field = frame[-5:-1].tobytes()
+        calculated_crc = crc16_modbus(frame[:-5])
+        if crc_field.strip(_CRC_DIGITS):
+            received_crc = -1
+        else:
+            received_crc = int(crc_field, 16)
 
         # Validate CRC
-        if calculated_crc != received_crc:
+        if received_crc != calculated_crc:
             raise ValueError(
-                f"CRC mismatch: received {received_crc}, "
-                f"calculated {calculated_crc}"
+                f"CRC mismatch: received {crc_field.decode('latin-1')}, "
+                f"calculated {calculated_crc:04X}"
             )
 
-        # Decode block type
-        if block_type_char >= DATA_BLOCK_OFFSET and block_type_char < DATA_BLOCK_OFFSET + 64:
-            # Data block
-            block_type = block_type_char - DATA_BLOCK_OFFSET
-        else:
-            # Control block
-            block_type = block_type_char
+        # Decode block type: data blocks are 0x20-0x5F, anything else is control.
+        # Wrapping the offset subtraction to a byte makes this a single compare.
+        block_num = (block_type_char - DATA_BLOCK_OFFSET) & 0xFF
+        block_type = block_num if block_num < 64 else block_type_char
 
-        # Extract payload (everything after 4-byte header)
-        payload = frame_data[4:]
+        # Extract payload (everything between 4-byte header and CRC)
+        payload = frame[4:-5].tobytes()
 
         return ARQFrame(protocol_version, stream_id, block_type, payload)
 
@@ -174,21 +262,9 @@ class ARQFrame:
 
     def _get_block_type_name(self) -> str:
         """Get human-readable block type name"""
-        type_map = {
-            CONREQ: 'CONREQ',
-            CONACK: 'CONACK',
-            STATUS: 'STATUS',
-            DISREQ: 'DISREQ',
-            DISACK: 'DISACK',
-            IDENT: 'IDENT',
-            POLL: 'POLL',
-            ABORT: 'ABORT',
-            ACKABORT: 'ACKABORT',
-            UNPROTO: 'UNPROTO',
-            TALK: 'TALK',
-        }
-        if self.block_type in type_map:
-            return type_map[self.block_type]
+        name = _BLOCK_TYPE_NAMES.get(self.block_type)
+        if name is not None:
+            return name
         elif self.block_type < 64:
             return f'DATA[{self.block_type}]'
         else:
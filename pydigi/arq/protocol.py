@@ -1,7 +1,8 @@
 """Main ARQ protocol implementation for FLARQ."""
 
 import time
-from typing import Optional, Callable, List
+from collections import deque
+from typing import Optional, Callable, Deque, Dict, List, Tuple
 from dataclasses import dataclass
 
 from .config import ARQConfig
@@ -11,7 +12,7 @@ from .frame import (
     IDENT, CONREQ, CONACK, REFUSED, DISREQ, STATUS, POLL,
     ABORT, ACKABORT, DISACK, UNPROTO, TALK,
 )
-from .blocks import BlockTracker
+from .blocks import BlockTracker, TxBlock, MAXCOUNT
 from .exceptions import (
     ARQError,
     ARQConnectionError,
@@ -20,6 +21,19 @@ from .exceptions import (
 )
 
 
+# Send bursts at least this long have their frame CRCs computed as one batch
+BATCH_CRC_MIN = 4
+
+# Errors a malformed or unexpected frame can raise; they are counted as bad
+# frames. Anything else is a bug and propagates.
+FRAME_ERRORS = (ARQError, ValueError, IndexError, KeyError)
+
+# Receive window: a data block is new only if it is at most this many blocks
+# ahead of GoodHeader. Anything else on the 64-block ring is a late resend of
+# a block already delivered; half the ring keeps the two apart.
+_RX_WINDOW = MAXCOUNT // 2
+
+
 @dataclass
 class ARQStatistics:
     """Statistics for ARQ link."""
@@ -39,6 +53,30 @@ class ARQProtocol:
     Reference: fldigi/src/flarq-src/arq.cxx
     """
 
+    # Every attribute is read on the per-frame path; slots skip the __dict__
+    __slots__ = (
+        'config', 'state', 'stats',
+        # Callbacks
+        '_send_callback', '_rx_text_callback', '_tx_text_callback', '_status_callback',
+        # Block tracking and frame building
+        '_tx_tracker', '_rx_tracker',
+        '_my_stream_id', '_ur_stream_id',
+        '_build_data_frame', '_build_data_frames', '_control_frames',
+        # Timing counters
+        '_retry_counter', '_timeout_counter', '_id_timer', '_tx_delay_counter',
+        '_connection_retries',
+        # Queues
+        '_tx_queue', '_rx_queue', '_frame_queue',
+        # Connection and frame handler state
+        '_ur_call', '_ur_block_length_char', '_conreq',
+        '_immediate', '_batching', '_status_pending',
+        '_tx_pending_nums', '_tx_pending_texts',
+        '_rx_pending_slots', '_rx_pending_mask',
+        '_tx_missing', '_tx_blocks',
+        '_ur_last_sent', '_ur_good_header', '_ur_end_header',
+        '_dispatch',
+    )
+
     def __init__(
         self,
         config: Optional[ARQConfig] = None,
@@ -69,6 +107,9 @@ class ARQProtocol:
         # Stream ID
         self._my_stream_id = self.config.my_stream_id
         self._ur_stream_id = '0'
+        self._build_data_frame = ARQFrame.make_builder('0', self._my_stream_id)
+        self._build_data_frames = ARQFrame.make_batch_builder('0', self._my_stream_id)
+        self._control_frames: Dict[int, Tuple[ARQFrame, bytes]] = {}  # Empty-payload frames
 
         # Timing counters (in loop iterations)
         self._retry_counter = 0          # Block retry timer
@@ -78,26 +119,51 @@ class ARQProtocol:
         self._connection_retries = 0     # Connection retry attempts
 
         # Queues
-        self._tx_queue: List[str] = []  # Outgoing text
-        self._rx_queue: List[str] = []  # Received text
-        self._frame_queue: List[bytes] = []  # Received frames to process
+        # FIFOs are deques so popping the head is O(1)
+        self._tx_queue: Deque[str] = deque()  # Outgoing text
+        self._rx_queue: Deque[str] = deque()  # Received text
+        self._frame_queue: Deque[bytes] = deque()  # Received frames to process
 
         # Connection state
         self._ur_call = ""  # Remote callsign from connection
         self._ur_block_length_char = '7'  # Remote block length
+        self._conreq: Optional[Tuple[ARQFrame, bytes]] = None  # Built by connect()
 
         # Frame handler state
         self._immediate = False  # Flag for immediate transmission
-        self._tx_pending: List[dict] = []  # Sent blocks pending acknowledgment
-        self._rx_pending: List[dict] = []  # Received blocks (not consecutive)
-        self._tx_missing: List[dict] = []  # Blocks needing retransmission
-        self._tx_blocks: List[dict] = []   # Blocks queued for transmission
+        self._batching = False  # True while _process_frames drains the queue
+        self._status_pending = False  # STATUS reply deferred to end of batch
+        # Sent blocks pending acknowledgment, as parallel number / text deques
+        self._tx_pending_nums: Deque[int] = deque()
+        self._tx_pending_texts: Deque[str] = deque()
+        # Received blocks (not consecutive): a block number can only be held
+        # once, so they live in one slot per block number
+        self._rx_pending_slots: List[Optional[str]] = [None] * MAXCOUNT
+        self._rx_pending_mask = 0  # Bit n set while slot n holds a block
+        self._tx_missing: Deque[TxBlock] = deque()  # Blocks needing retransmission
+        self._tx_blocks: Deque[TxBlock] = deque()   # Blocks queued for transmission
 
         # Remote station's block tracking
         self._ur_last_sent = 0
         self._ur_good_header = 0
         self._ur_end_header = 0
 
+        # Control frame handlers by block type (data frames are 0-63)
+        self._dispatch = {
+            CONREQ: self._handle_conreq,
+            CONACK: self._handle_conack,
+            REFUSED: self._handle_refused,
+            DISREQ: self._handle_disreq,
+            DISACK: self._handle_disack,
+            ABORT: self._handle_abort,
+            ACKABORT: self._handle_ackabort,
+            STATUS: self._handle_status,
+            POLL: self._handle_poll,
+            IDENT: self._handle_ident,
+            UNPROTO: self._handle_unproto,
+            TALK: self._handle_talk,
+        }
+
     def set_send_callback(self, callback: Callable[[bytes], None]) -> None:
         """Set callback for sending frames.
 
@@ -137,28 +203,49 @@ class ARQProtocol:
             minutes: Minutes until next ID frame (default: 10)
         """
         if minutes is None:
-            minutes = 10  # Default 10 minutes
-
-        # Convert to loop iterations: (minutes * 60 - 10) seconds * 1000ms / loop_time
-        self._id_timer = ((minutes * 60 - 10) * 1000) // self.config.loop_time
+            # Default 10 minutes, precomputed by the config
+            self._id_timer = self.config.id_ticks
+        else:
+            self._id_timer = self.config.id_ticks_for(minutes)
 
-    def _send_frame(self, frame: ARQFrame) -> None:
+    def _send_frame(self, frame: Optional[ARQFrame], frame_bytes: Optional[bytes] = None) -> None:
         """Send a frame via callback.
 
         Args:
-            frame: ARQFrame object to send
+            frame: ARQFrame object to send; only read for building and for the
+                TX callback, so it may be None if frame_bytes is given and no
+                TX callback is set
+            frame_bytes: Already-built frame bytes (built from frame if None)
         """
-        if self._send_callback:
-            frame_bytes = frame.build()
-            self._send_callback(frame_bytes)
+        send_callback = self._send_callback
+        if send_callback:
+            if frame_bytes is None:
+                frame_bytes = frame.build()
+            send_callback(frame_bytes)
             self.stats.total_tx += 1
 
-            # Reset ID timer after sending any frame
-            self._set_id_timer()
+            # Reset ID timer after sending any frame (same as _set_id_timer())
+            self._id_timer = self.config.id_ticks
 
             # Call TX callback if set
-            if self._tx_text_callback:
-                self._tx_text_callback(f"TX: {frame}")
+            tx_text_callback = self._tx_text_callback
+            if tx_text_callback:
+                tx_text_callback(f"TX: {frame}")
+
+    def _send_control(self, block_type: int) -> None:
+        """Send a control frame with an empty payload.
+
+        These frames never change within a session, so each is built once
+        and its bytes reused.
+
+        Args:
+            block_type: Control block type (POLL, IDENT, DISREQ, ...)
+        """
+        cached = self._control_frames.get(block_type)
+        if cached is None:
+            frame = ARQFrame('0', self._my_stream_id, block_type, b'')
+            cached = self._control_frames[block_type] = (frame, frame.build())
+        self._send_frame(*cached)
 
     def _emit_status(self, message: str) -> None:
         """Emit status message via callback.
@@ -206,19 +293,21 @@ class ARQProtocol:
             f"T{timeout_sec}R{self.config.retries}W{retry_sec}"
         )
 
-        # Build and send CONREQ frame
+        # Build and send CONREQ frame; its inputs are fixed for this
+        # connection attempt, so timeout retries resend the same bytes
         frame = ARQFrame(
             protocol_version='0',
             stream_id=self._my_stream_id,
             block_type=CONREQ,
             payload=payload
         )
+        self._conreq = (frame, frame.build())
 
-        self._send_frame(frame)
+        self._send_frame(*self._conreq)
         self._emit_status(f"Connecting to {self._ur_call}...")
 
         # Start timeout counter
-        self._timeout_counter = self.config.timeout // self.config.loop_time
+        self._timeout_counter = self.config.timeout_ticks
 
         # Initialize ID timer
         self._set_id_timer()
@@ -235,22 +324,15 @@ class ARQProtocol:
         # Update state
         self.state.transition_to(LinkState.DISCONNECT)
 
-        # Build and send DISREQ frame
-        frame = ARQFrame(
-            protocol_version='0',
-            stream_id=self._my_stream_id,
-            block_type=DISREQ,
-            payload=''
-        )
-
-        self._send_frame(frame)
+        # Send DISREQ frame
+        self._send_control(DISREQ)
         self._emit_status("Disconnecting...")
 
         # Transition to disconnecting
         self.state.transition_to(LinkState.DISCONNECTING)
 
         # Start timeout counter
-        self._timeout_counter = self.config.timeout // self.config.loop_time
+        self._timeout_counter = self.config.timeout_ticks
 
     def abort(self) -> None:
         """Abort current transfer.
@@ -263,27 +345,22 @@ class ARQProtocol:
         else:
             self.state.transition_to(LinkState.ABORTING, force=True)
 
-        # Build and send ABORT frame
-        frame = ARQFrame(
-            protocol_version='0',
-            stream_id=self._my_stream_id,
-            block_type=ABORT,
-            payload=''
-        )
-
-        self._send_frame(frame)
+        # Send ABORT frame
+        self._send_control(ABORT)
         self._emit_status("Aborting transfer...")
 
     def _reset_tx(self) -> None:
         """Reset TX state (clear all transmit queues and counters)."""
         self._tx_blocks.clear()
         self._tx_missing.clear()
-        self._tx_pending.clear()
+        self._tx_pending_nums.clear()
+        self._tx_pending_texts.clear()
         self._tx_tracker.reset_tx()
 
     def _reset_rx(self) -> None:
         """Reset RX state (clear all receive queues and counters)."""
-        self._rx_pending.clear()
+        self._rx_pending_slots = [None] * MAXCOUNT
+        self._rx_pending_mask = 0
         self._rx_queue.clear()
         self._rx_tracker.reset_rx()
 
@@ -305,10 +382,29 @@ class ARQProtocol:
         self.stats.total_rx += 1
 
     def _process_frames(self) -> None:
-        """Process all queued frames."""
-        while self._frame_queue:
-            frame_bytes = self._frame_queue.pop(0)
-            self._process_frame(frame_bytes)
+        """Process all queued frames.
+
+        POLL and IDENT frames in the same batch all want the same STATUS
+        reply, so it is sent once after the queue is drained.
+        """
+        self._batching = True
+        try:
+            while self._frame_queue:
+                frame_bytes = self._frame_queue.popleft()
+                self._process_frame(frame_bytes)
+        finally:
+            self._batching = False
+
+        if self._status_pending:
+            self._status_pending = False
+            self._send_status()
+
+    def _request_status(self) -> None:
+        """Reply with STATUS, deferred to the end of a frame batch."""
+        if self._batching:
+            self._status_pending = True
+        else:
+            self._send_status()
 
     def _process_frame(self, frame_bytes: bytes) -> None:
         """Process a single received frame.
@@ -321,44 +417,22 @@ class ARQProtocol:
             frame = ARQFrame.parse(frame_bytes)
 
             # Set TX delay - wait before transmitting after receiving
-            self._tx_delay_counter = self.config.tx_delay // self.config.loop_time
+            self._tx_delay_counter = self.config.tx_delay_ticks
 
             # Route to appropriate handler based on block type
             block_type = frame.block_type
+            handler = self._dispatch.get(block_type)
 
-            if block_type == CONREQ:
-                self._handle_conreq(frame)
-            elif block_type == CONACK:
-                self._handle_conack(frame)
-            elif block_type == REFUSED:
-                self._handle_refused(frame)
-            elif block_type == DISREQ:
-                self._handle_disreq(frame)
-            elif block_type == DISACK:
-                self._handle_disack(frame)
-            elif block_type == ABORT:
-                self._handle_abort(frame)
-            elif block_type == ACKABORT:
-                self._handle_ackabort(frame)
-            elif block_type == STATUS:
-                self._handle_status(frame)
-            elif block_type == POLL:
-                self._handle_poll(frame)
-            elif block_type == IDENT:
-                self._handle_ident(frame)
-            elif block_type == UNPROTO:
-                self._handle_unproto(frame)
-            elif block_type == TALK:
-                self._handle_talk(frame)
-            else:
+            if handler is not None:
+                handler(frame)
+            elif 0 <= block_type < 64:
                 # Data frame (block number 0-63)
-                if 0 <= block_type < 64:
-                    self._handle_data(frame)
-                else:
-                    # Unknown frame type
-                    self._emit_status(f"Unknown frame type: {block_type}")
+                self._handle_data(frame)
+            else:
+                # Unknown frame type
+                self._emit_status(f"Unknown frame type: {block_type}")
 
-        except Exception as e:
+        except FRAME_ERRORS as e:
             self.stats.bad_rx += 1
             self._emit_status(f"Frame processing error: {e}")
 
@@ -372,7 +446,7 @@ class ARQProtocol:
         """
         # Parse payload
         # Format: "MYCALL:port URCALL:port StreamID BlockLengthChar ..."
-        payload = frame.payload
+        payload = frame.payload.decode('latin-1')
         parts = payload.split()
 
         if len(parts) < 4:
@@ -408,7 +482,7 @@ class ARQProtocol:
             return
 
         # Parse payload to get remote parameters
-        payload = frame.payload
+        payload = frame.payload.decode('latin-1')
         parts = payload.split()
 
         if len(parts) >= 4:
@@ -510,6 +584,7 @@ class ARQProtocol:
         if not self.state.is_connected():
             return
 
+        # Payload is bytes, so indexing yields the block characters as ints
         payload = frame.payload
 
         # Must have at least 3 bytes (LastHeader, GoodHeader, EndHeader)
@@ -518,62 +593,68 @@ class ARQProtocol:
             return
 
         # Parse remote station's block tracking info
-        ur_last_sent = ord(payload[0]) - 0x20
-        ur_good_header = ord(payload[1]) - 0x20
-        ur_end_header = ord(payload[2]) - 0x20
+        ur_last_sent = payload[0] - 0x20
+        ur_good_header = payload[1] - 0x20
+        ur_end_header = payload[2] - 0x20
 
         # Store remote station's info
         self._ur_last_sent = ur_last_sent
         self._ur_good_header = ur_good_header
         self._ur_end_header = ur_end_header
 
-        # Parse missing blocks list from remote
-        ur_missing = []
-        for i in range(3, len(payload)):
-            block_num = ord(payload[i]) - 0x20
-            ur_missing.append(block_num)
-
-        # Build complete missing list
+        # Build complete missing set
         # Include explicitly reported missing blocks
-        missing = list(ur_missing)
+        missing = {b - 0x20 for b in payload[3:]}
 
         # Also include blocks between EndHeader and our LastSent that weren't acknowledged
-        if ur_end_header != self._tx_tracker.last_sent:
-            m = ur_end_header + 1
-            if m > 63:
-                m -= 64
-
-            while m != self._tx_tracker.last_sent:
-                missing.append(m)
-                m += 1
-                if m > 63:
-                    m -= 64
+        last_sent = self._tx_tracker.last_sent
+        if ur_end_header != last_sent:
+            # Block numbers live on a 64-entry ring, so wrapping is a mask
+            m = (ur_end_header + 1) & 63
+            while m != last_sent:
+                missing.add(m)
+                m = (m + 1) & 63
 
             # Add the last sent block too
-            missing.append(self._tx_tracker.last_sent)
+            missing.add(last_sent)
 
         # Update TxMissing queue - keep only blocks that are still missing
         if not missing:
             # All blocks acknowledged, clear missing queue
             self._tx_missing.clear()
         else:
-            # Keep only blocks that are in the missing list
-            self._tx_missing = [b for b in self._tx_missing if b['block_num'] in missing]
+            # Keep only blocks that are in the missing set
+            self._tx_missing = deque(b for b in self._tx_missing if b.block_num in missing)
 
         # Process TxPending queue - remove blocks up to and including GoodHeader
         # These have been successfully received by remote station
-        while self._tx_pending:
-            block = self._tx_pending[0]
-            if block['block_num'] <= ur_good_header or \
-               (ur_good_header < 10 and block['block_num'] > 50):  # Handle wrap
-                # Block acknowledged, remove from pending
-                self._tx_pending.pop(0)
-
-                # Call TX callback to show transmitted text
-                if self._tx_text_callback:
-                    self._tx_text_callback(block['text'])
-            else:
-                break
+        pending_nums = self._tx_pending_nums
+        while pending_nums and self._acked(pending_nums[0], ur_good_header, last_sent):
+            pending_nums.popleft()
+            text = self._tx_pending_texts.popleft()
+
+            # Call TX callback to show transmitted text
+            if self._tx_text_callback:
+                self._tx_text_callback(text)
+
+    @staticmethod
+    def _acked(block_num: int, good_header: int, last_sent: int) -> bool:
+        """Check whether a pending block is covered by the remote GoodHeader.
+
+        Pending blocks run consecutively (mod 64) from the oldest up to
+        last_sent, so block_num is acknowledged when good_header lies on
+        that stretch of the ring. A stale good_header sits just behind
+        block_num and is the full ring distance away.
+
+        Args:
+            block_num: Oldest unacknowledged block
+            good_header: Remote station's last consecutive block received
+            last_sent: Our last block sent
+
+        Returns:
+            True if block_num has been received by the remote station
+        """
+        return ((good_header - block_num) & 63) <= ((last_sent - block_num) & 63)
 
     def _handle_poll(self, frame: ARQFrame) -> None:
         """Handle POLL frame.
@@ -593,7 +674,7 @@ class ARQProtocol:
             return
 
         # Send STATUS response
-        self._send_status()
+        self._request_status()
 
         # Mark for immediate transmission
         self._immediate = True
@@ -614,10 +695,10 @@ class ARQProtocol:
             frame: Parsed IDENT frame
         """
         # Reset timeout counter
-        self._timeout_counter = self.config.timeout // self.config.loop_time
+        self._timeout_counter = self.config.timeout_ticks
 
         # Send STATUS response
-        self._send_status()
+        self._request_status()
 
         # Mark for immediate transmission
         self._immediate = True
@@ -644,80 +725,57 @@ class ARQProtocol:
         if not self.state.is_connected():
             return
 
-        # Extract block number from block type
-        # block_type is already decoded as int by ARQFrame.parse()
-        if isinstance(frame.block_type, int):
-            block_num = frame.block_type
-        else:
-            # For compatibility with tests that pass chr(0x20 + block_num)
-            block_num = ord(frame.block_type) - 0x20
-
-        # Check for duplicate (already received)
-        for pending in self._rx_pending:
-            if pending['block_num'] == block_num:
-                # Duplicate, ignore
-                return
-
-        self._emit_status(f"RX: data block {block_num}")
-
-        # Add to pending queue
-        self._rx_pending.append({
-            'block_num': block_num,
-            'text': frame.payload
-        })
-
-        # Sort pending blocks by block number (with modulo-64 handling)
-        def sort_key(block):
-            num = block['block_num']
-            # Adjust for wrap boundary
-            if num < self._rx_tracker.good_header:
-                num += 64
-            return num
-
-        self._rx_pending.sort(key=sort_key)
-
-        # Update EndHeader (last received, possibly with gaps)
-        if self._rx_pending:
-            self._rx_tracker.end_header = self._rx_pending[-1]['block_num']
-        else:
-            self._rx_tracker.end_header = self._rx_tracker.good_header
-
-        # Process consecutive blocks from pending queue
-        while self._rx_pending:
-            block = self._rx_pending[0]
-            next_expected = (self._rx_tracker.good_header + 1) % 64
-
-            if block['block_num'] != next_expected:
-                # Gap in sequence, stop processing
-                break
+        # Block number is the block type; ARQFrame only holds int block
+        # types and _process_frame routes 0-63 here
+        block_num = frame.block_type
+
+        # Only blocks in the forward receive window are new. A resent
+        # GoodHeader block, or a late resend of one delivered before it, sits
+        # at or behind GoodHeader and must not be held: its slot would later
+        # swallow the real block with that number. Blocks already held are
+        # duplicates too.
+        good_header = self._rx_tracker.good_header
+        ahead = (block_num - good_header) & 63
+        if ahead == 0 or ahead > _RX_WINDOW or self._rx_pending_mask >> block_num & 1:
+            return
 
+        if self._status_callback:
+            self._emit_status(f"RX: data block {block_num}")
+
+        # Hold the block in its slot
+        slots = self._rx_pending_slots
+        slots[block_num] = frame.payload.decode('latin-1')
+        self._rx_pending_mask |= 1 << block_num
+
+        # Update EndHeader (last received, possibly with gaps): the held block
+        # furthest along the ring from GoodHeader, i.e. the highest one below
+        # GoodHeader if the ring has wrapped, otherwise the highest overall
+        pending = self._rx_pending_mask
+        wrapped = pending & ((1 << good_header) - 1)
+        self._rx_tracker.end_header = (wrapped or pending).bit_length() - 1
+
+        # Process consecutive blocks from the slots
+        num = (good_header + 1) & 63
+        while self._rx_pending_mask >> num & 1:
             # Block is next in sequence
-            self._rx_pending.pop(0)
+            text = slots[num]
+            slots[num] = None
+            self._rx_pending_mask &= ~(1 << num)
 
             # Add text to receive queue
-            self._rx_queue.append(block['text'])
+            self._rx_queue.append(text)
 
             # Update GoodHeader
-            self._rx_tracker.good_header = block['block_num']
+            self._rx_tracker.good_header = num
 
             # Call RX callback
             if self._rx_text_callback:
-                self._rx_text_callback(block['text'])
+                self._rx_text_callback(text)
 
-        # Update missing blocks list
-        self._update_missing_blocks()
+            num = (num + 1) & 63
 
-    def _update_missing_blocks(self) -> None:
-        """Update list of missing received blocks.
-
-        This is called after processing DATA frames to determine which
-        blocks are missing between GoodHeader and EndHeader.
-
-        Note: The BlockTracker.get_missing_blocks() method already handles
-        this calculation, so we don't need to do anything here. The missing
-        blocks will be calculated when we send a STATUS frame.
-        """
-        pass
+        # Missing blocks are not tracked here; _get_missing_blocks() derives
+        # them from the pending mask when a STATUS frame is built
 
     def _get_missing_blocks(self) -> list:
         """Get list of missing blocks between GoodHeader and EndHeader.
@@ -728,27 +786,21 @@ class ARQProtocol:
         if self._rx_tracker.good_header == self._rx_tracker.end_header:
             return []
 
-        missing = []
-        pending_nums = {b['block_num'] for b in self._rx_pending}
-
         # Range to check: (good_header + 1) to end_header (exclusive)
-        start = (self._rx_tracker.good_header + 1) % 64
-        end = self._rx_tracker.end_header
-
-        # Handle wrapping
-        if end < start:
-            # Wraps around, check in two parts
-            for i in range(start, 64):
-                if i not in pending_nums:
-                    missing.append(i)
-            for i in range(0, end):
-                if i not in pending_nums:
-                    missing.append(i)
-        else:
-            # No wrap
-            for i in range(start, end):
-                if i not in pending_nums:
-                    missing.append(i)
+        start = (self._rx_tracker.good_header + 1) & 63
+        count = (self._rx_tracker.end_header - start) & 63
+
+        # Rotate the pending mask so bit k stands for block start + k; the
+        # wrap then needs no special case and blocks come out in ring order
+        pending = self._rx_pending_mask
+        rotated = (pending >> start) | (pending << (64 - start))
+        missing_mask = ~rotated & ((1 << count) - 1)
+
+        missing = []
+        while missing_mask:
+            bit = missing_mask & -missing_mask
+            missing.append((bit.bit_length() - 1 + start) & 63)
+            missing_mask ^= bit
 
         return missing
 
@@ -773,69 +825,50 @@ class ARQProtocol:
 
     def _send_refused(self) -> None:
         """Send REFUSED frame."""
-        frame = ARQFrame(
-            protocol_version='0',
-            stream_id=self._my_stream_id,
-            block_type=REFUSED,
-            payload=''
-        )
-
-        self._send_frame(frame)
+        self._send_control(REFUSED)
 
     def _send_disack(self) -> None:
         """Send DISACK frame."""
-        frame = ARQFrame(
-            protocol_version='0',
-            stream_id=self._my_stream_id,
-            block_type=DISACK,
-            payload=''
-        )
+        self._send_control(DISACK)
 
-        self._send_frame(frame)
+    def _status_payload(self, missing: List[int]) -> bytes:
+        """Build a STATUS/ACKABORT payload.
 
-    def _send_status(self) -> None:
-        """Send STATUS frame with current block tracking info."""
-        # Build status payload
-        # Format: [LastHeader][GoodHeader][EndHeader][Missing blocks...]
-        payload = chr(0x20 + self._tx_tracker.last_sent)
-        payload += chr(0x20 + self._rx_tracker.good_header)
-        payload += chr(0x20 + self._rx_tracker.end_header)
+        Format: [LastHeader][GoodHeader][EndHeader][Missing blocks...],
+        each a block number offset by 0x20.
+
+        Args:
+            missing: Missing block numbers to report
 
-        # Add missing blocks to payload
-        missing = self._get_missing_blocks()
-        for block_num in missing:
-            payload += chr(0x20 + block_num)
+        Returns:
+            Payload bytes
+        """
+        buf = bytearray(3 + len(missing))
+        buf[0] = 0x20 + self._tx_tracker.last_sent
+        buf[1] = 0x20 + self._rx_tracker.good_header
+        buf[2] = 0x20 + self._rx_tracker.end_header
+        for i, block_num in enumerate(missing, 3):
+            buf[i] = 0x20 + block_num
+        return bytes(buf)
 
+    def _send_status(self) -> None:
+        """Send STATUS frame with current block tracking info."""
         frame = ARQFrame(
             protocol_version='0',
             stream_id=self._my_stream_id,
             block_type=STATUS,
-            payload=payload
+            payload=self._status_payload(self._get_missing_blocks())
         )
 
         self._send_frame(frame)
 
     def _send_ident(self) -> None:
         """Send IDENT frame."""
-        frame = ARQFrame(
-            protocol_version='0',
-            stream_id=self._my_stream_id,
-            block_type=IDENT,
-            payload=''
-        )
-
-        self._send_frame(frame)
+        self._send_control(IDENT)
 
     def _send_poll(self) -> None:
         """Send POLL frame to request STATUS."""
-        frame = ARQFrame(
-            protocol_version='0',
-            stream_id=self._my_stream_id,
-            block_type=POLL,
-            payload=''
-        )
-
-        self._send_frame(frame)
+        self._send_control(POLL)
 
     def _send_talk(self, message: str = "auto ID") -> None:
         """Send TALK frame for keepalive/identification.
@@ -864,42 +897,63 @@ class ARQProtocol:
 
         ACKABORT includes status payload like STATUS frame.
         """
-        # Build status payload (same as STATUS)
-        # Format: [LastHeader][GoodHeader][EndHeader][Missing blocks...]
-        payload = chr(0x20 + self._tx_tracker.last_sent)
-        payload += chr(0x20 + self._rx_tracker.good_header)
-        payload += chr(0x20 + self._rx_tracker.end_header)
-
-        # Add missing blocks
-        missing = self._get_missing_blocks()
-        for block_num in missing[:self.config.max_headers]:
-            payload += chr(0x20 + block_num)
-
+        # Same payload as STATUS, missing list capped at max_headers
+        missing = self._get_missing_blocks()[:self.config.max_headers]
         frame = ARQFrame(
             protocol_version='0',
             stream_id=self._my_stream_id,
             block_type=ACKABORT,
-            payload=payload
+            payload=self._status_payload(missing)
         )
 
         self._send_frame(frame)
 
-    def _send_data_frame(self, block: dict) -> None:
+    def _send_data_frame(self, block: TxBlock, frame_bytes: Optional[bytes] = None) -> None:
         """Send a data block frame.
 
         Args:
-            block: Block dictionary with 'block_num' and 'text'
+            block: Block to send; the built frame is kept on it for
+                retransmission
+            frame_bytes: Already-built frame bytes (built here if None)
         """
-        # Build DATA frame
+        # Build DATA frame once; retransmissions resend the same bytes
         # Block type is block_num (0-63)
-        frame = ARQFrame(
-            protocol_version='0',
-            stream_id=self._my_stream_id,
-            block_type=block['block_num'],  # 0-63 for data blocks
-            payload=block['text']
-        )
+        block_num = block.block_num
+        if frame_bytes is None:
+            frame_bytes = block.frame_bytes
+            if frame_bytes is None:
+                frame_bytes = self._build_data_frame(block_num, block.text)
+                block.frame_bytes = frame_bytes
+
+        # The frame object is only needed to describe it to the TX callback
+        frame = None
+        if self._tx_text_callback:
+            frame = ARQFrame(
+                protocol_version='0',
+                stream_id=self._my_stream_id,
+                block_type=block_num,  # 0-63 for data blocks
+                payload=block.text
+            )
+        self._send_frame(frame, frame_bytes)
 
-        self._send_frame(frame)
+    def _send_data_frames(self, blocks: List[TxBlock]) -> None:
+        """Send several data block frames in order.
+
+        Blocks that have not been sent before are built first; when there
+        are BATCH_CRC_MIN or more of them their CRCs are computed in a
+        single batched pass.
+
+        Args:
+            blocks: Blocks to send
+        """
+        unbuilt = [b for b in blocks if b.frame_bytes is None]
+        if len(unbuilt) >= BATCH_CRC_MIN:
+            frames = self._build_data_frames([(b.block_num, b.text) for b in unbuilt])
+            for block, frame_bytes in zip(unbuilt, frames):
+                block.frame_bytes = frame_bytes
+
+        for block in blocks:
+            self._send_data_frame(block)
 
     # Text Transmission Methods
 
@@ -931,11 +985,7 @@ class ARQProtocol:
             block_num = self._tx_tracker.next_block_number()
 
             # Add to transmission queue
-            block = {
-                'block_num': block_num,
-                'text': chunk
-            }
-            self._tx_blocks.append(block)
+            self._tx_blocks.append(TxBlock(block_num, chunk))
             blocks_added += 1
 
             offset += buffer_length
@@ -951,42 +1001,44 @@ class ARQProtocol:
         if not self.state.is_connected():
             return
 
-        frames_sent = 0
-        retransmissions = 0
-        new_blocks = 0
+        max_headers = self.config.max_headers
+        tx_missing = self._tx_missing
+        tx_blocks = self._tx_blocks
 
-        # First, send missing blocks (retransmissions)
-        while self._tx_missing and frames_sent < self.config.max_headers:
-            block = self._tx_missing.pop(0)
-            self._send_data_frame(block)
-            frames_sent += 1
-            retransmissions += 1
+        # First, pick missing blocks (retransmissions); the count is known
+        # up front, so drain them without a per-item bound check
+        retransmissions = min(len(tx_missing), max_headers)
+        popleft = tx_missing.popleft
+        to_send = [popleft() for _ in range(retransmissions)]
 
-        # Then send new blocks from queue
-        while self._tx_blocks and frames_sent < self.config.max_headers:
-            block = self._tx_blocks.pop(0)
+        # Then pick new blocks from queue
+        new_blocks = 0
+        # Don't send if we're 2 blocks ahead of remote's GoodHeader
+        # This prevents buffer overflow at receiver
+        window_end = (self._ur_good_header - 2) & 63
+        for _ in range(min(len(tx_blocks), max_headers - retransmissions)):
+            block = tx_blocks[0]
 
             # Check if send window is full
-            # Don't send if we're 2 blocks ahead of remote's GoodHeader
-            # This prevents buffer overflow at receiver
-            if (block['block_num'] + 2) % 64 == self._ur_good_header:
-                # Window full, put block back
-                self._tx_blocks.insert(0, block)
+            if block.block_num == window_end:
                 break
 
-            # Send the block
-            self._send_data_frame(block)
+            tx_blocks.popleft()
+            to_send.append(block)
 
             # Add to pending and missing queues
-            self._tx_pending.append(block)
-            self._tx_missing.append(block)
+            self._tx_pending_nums.append(block.block_num)
+            self._tx_pending_texts.append(block.text)
+            tx_missing.append(block)
 
             # Update tracker
-            self._tx_tracker.last_sent = block['block_num']
+            self._tx_tracker.last_sent = block.block_num
 
-            frames_sent += 1
             new_blocks += 1
 
+        frames_sent = retransmissions + new_blocks
+        self._send_data_frames(to_send)
+
         # Send POLL if we sent anything
         if frames_sent > 0:
             self._send_poll()
@@ -1011,17 +1063,30 @@ class ARQProtocol:
         This should be called regularly (every 100ms recommended).
         Processes received frames, handles timeouts, and sends blocks.
         """
+        # Each counter is read into a local once per tick and written back
+        # once, instead of separate load/compare/store round trips through
+        # the instance slots. Handlers may reset counters, so each is read
+        # at the point of use.
+        #
+        # The config and state objects live as long as the protocol, so their
+        # lookups are bound once here. The connected check is still called at
+        # each use since frame handlers change state.
+        is_connected = self.state.is_connected
+        retry_ticks = self.config.retry_ticks
+
         # Decrement ID timer (keepalive)
-        if self._id_timer > 0:
-            self._id_timer -= 1
-            if self._id_timer == 0 and self.state.is_connected():
+        id_timer = self._id_timer
+        if id_timer > 0:
+            self._id_timer = id_timer = id_timer - 1
+            if id_timer == 0 and is_connected():
                 # Send keepalive TALK frame
                 self._send_talk("auto ID")
                 # Timer will be reset by _send_frame()
 
         # Decrement TX delay counter
-        if self._tx_delay_counter > 0:
-            self._tx_delay_counter -= 1
+        tx_delay = self._tx_delay_counter
+        if tx_delay > 0:
+            self._tx_delay_counter = tx_delay - 1
 
         # Process received frames
         self._process_frames()
@@ -1031,31 +1096,33 @@ class ARQProtocol:
 
         # Send blocks if immediate flag set or in appropriate state
         if can_transmit and (self._immediate or (
-            self.state.is_connected() and
+            is_connected() and
             (self._tx_blocks or self._tx_missing)
         )):
             self._send_blocks()
             self._immediate = False
 
             # Reset retry counter
-            self._retry_counter = self.config.retry_time // self.config.loop_time
+            self._retry_counter = retry_ticks
 
         # Update timeout counter
-        if self._timeout_counter > 0:
-            self._timeout_counter -= 1
+        timeout = self._timeout_counter
+        if timeout > 0:
+            self._timeout_counter = timeout = timeout - 1
 
-            if self._timeout_counter == 0:
+            if timeout == 0:
                 self._handle_timeout()
 
         # Update retry counter for block retransmissions
-        if self._retry_counter > 0:
-            self._retry_counter -= 1
+        retry = self._retry_counter
+        if retry > 0:
+            self._retry_counter = retry = retry - 1
 
-            if self._retry_counter == 0:
+            if retry == 0:
                 # Retry sending blocks
-                if can_transmit and self.state.is_connected() and (self._tx_blocks or self._tx_missing):
+                if can_transmit and is_connected() and (self._tx_blocks or self._tx_missing):
                     self._send_blocks()
-                    self._retry_counter = self.config.retry_time // self.config.loop_time
+                    self._retry_counter = retry_ticks
 
     def _handle_timeout(self) -> None:
         """Handle timeout event."""
@@ -1065,27 +1132,11 @@ class ARQProtocol:
                 self._connection_retries -= 1
                 self._emit_status(f"Connection timeout, retrying... ({self._connection_retries} attempts left)")
 
-                # Resend CONREQ
-                block_length_char = chr(ord('0') + self.config.exponent)
-                timeout_sec = self.config.timeout // 1000
-
-                payload = (
-                    f"{self.config.my_call}:0 {self._ur_call}:0 "
-                    f"{self._my_stream_id} {block_length_char} "
-                    f"T{timeout_sec}R{self.config.retries}W{self.config.retry_time // 1000}"
-                )
-
-                frame = ARQFrame(
-                    protocol_version='0',
-                    stream_id=self._my_stream_id,
-                    block_type=CONREQ,
-                    payload=payload
-                )
-
-                self._send_frame(frame)
+                # Resend the CONREQ built by connect()
+                self._send_frame(*self._conreq)
 
                 # Reset timeout counter
-                self._timeout_counter = self.config.timeout // self.config.loop_time
+                self._timeout_counter = self.config.timeout_ticks
             else:
                 # No retries left, give up
                 self.state.transition_to(LinkState.TIMEDOUT)
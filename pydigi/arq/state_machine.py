@@ -23,6 +23,36 @@ class LinkState(IntEnum):
     STOPPED = auto()  # Protocol stopped
 
 
+# State groups for the is_*() checks, built once instead of per call
+_CONNECTED_STATES = frozenset((
+    LinkState.ARQ_CONNECTED,
+    LinkState.WAITING,
+    LinkState.WAITFORACK,
+))
+_DISCONNECTING_STATES = frozenset((
+    LinkState.DISCONNECT,
+    LinkState.DISCONNECTING,
+))
+_ERROR_STATES = frozenset((
+    LinkState.TIMEDOUT,
+    LinkState.ABORT,
+))
+
+
+def _transition_table(transitions: dict) -> tuple:
+    """Flatten a transition dict into a tuple indexed by state value.
+
+    Args:
+        transitions: Mapping of state to the set of states it may move to
+
+    Returns:
+        Tuple of frozensets, one per LinkState value (empty if absent)
+    """
+    return tuple(
+        frozenset(transitions.get(state, ())) for state in sorted(LinkState)
+    )
+
+
 class ARQStateMachine:
     """State machine for ARQ protocol connection management.
 
@@ -85,6 +115,9 @@ class ARQStateMachine:
         },
     }
 
+    # TRANSITIONS as a tuple indexed by state value, for can_transition_to()
+    _ALLOWED = _transition_table(TRANSITIONS)
+
     def __init__(self, initial_state: LinkState = LinkState.DOWN):
         """Initialize state machine.
 
@@ -121,13 +154,9 @@ class ARQStateMachine:
         Returns:
             True if transition is allowed
         """
-        # Same state is always allowed
-        if new_state == self._state:
-            return True
-
-        # Check if transition is in allowed set
-        allowed = self.TRANSITIONS.get(self._state, set())
-        return new_state in allowed
+        # Same state is always allowed, otherwise check the allowed set
+        state = self._state
+        return new_state == state or new_state in self._ALLOWED[state]
 
     def transition_to(self, new_state: LinkState, force: bool = False) -> None:
         """Transition to new state.
@@ -158,11 +187,7 @@ class ARQStateMachine:
         Returns:
             True if in any connected state
         """
-        return self._state in {
-            LinkState.ARQ_CONNECTED,
-            LinkState.WAITING,
-            LinkState.WAITFORACK,
-        }
+        return self._state in _CONNECTED_STATES
 
     def is_connecting(self) -> bool:
         """Check if connection is in progress.
@@ -178,10 +203,7 @@ class ARQStateMachine:
         Returns:
             True if disconnecting
         """
-        return self._state in {
-            LinkState.DISCONNECT,
-            LinkState.DISCONNECTING,
-        }
+        return self._state in _DISCONNECTING_STATES
 
     def is_error_state(self) -> bool:
         """Check if in error state.
@@ -189,10 +211,7 @@ class ARQStateMachine:
         Returns:
             True if in error state
         """
-        return self._state in {
-            LinkState.TIMEDOUT,
-            LinkState.ABORT,
-        }
+        return self._state in _ERROR_STATES
 
     def __repr__(self) -> str:
         """String representation.
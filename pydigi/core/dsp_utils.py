@@ -5,33 +5,58 @@ This module provides common DSP functions used across multiple modem implementat
 reducing code duplication and ensuring consistent signal processing.
 """
 
+import math
+from functools import lru_cache
+
 import numpy as np
 from scipy import signal
 from typing import Tuple
 
 
+@lru_cache(maxsize=16)
 def generate_raised_cosine_shape(length: int) -> np.ndarray:
     """
     Generate raised cosine pulse shape for symbol transitions.
 
     This implements the same shape as fldigi's tx_shape,
     which creates smooth transitions between symbols to prevent spectral splatter.
+    Shapes are cached by length, since the symbol length is fixed per modem.
 
     Args:
         length: Number of samples in the shape (symbol length)
 
     Returns:
-        Array of shape coefficients (1.0 to 0.0)
+        Read-only array of shape coefficients (1.0 to 0.0); copy it to modify
 
     Reference:
         fldigi/psk/psk.cxx:1052
         Formula: 0.5 * cos(i * PI / symbollen) + 0.5
     """
-    n = np.arange(length)
-    shape = 0.5 * np.cos(n * np.pi / length) + 0.5
+    n = np.arange(length, dtype=np.float32)
+    shape = np.cos(n * np.float32(np.pi / length))
+    shape *= np.float32(0.5)
+    shape += np.float32(0.5)
+    # The array is shared between callers through the cache
+    shape.flags.writeable = False
     return shape
 
 
+@lru_cache(maxsize=16)
+def _butter_lowpass_sos(order: int, cutoff_normalized: float) -> np.ndarray:
+    """
+    Design a Butterworth lowpass filter as second-order sections (cached).
+
+    Args:
+        order: Filter order
+        cutoff_normalized: Cutoff as a fraction of Nyquist
+
+    Returns:
+        SOS coefficient array (shared; do not modify)
+    """
+    # Left writeable: scipy's sosfilt kernels reject read-only buffers
+    return signal.butter(order, cutoff_normalized, btype="low", output="sos")
+
+
 def apply_baseband_filter(
     i_samples: np.ndarray, q_samples: np.ndarray, baud: float, sample_rate: float
 ) -> Tuple[np.ndarray, np.ndarray]:
@@ -62,14 +87,17 @@ def apply_baseband_filter(
     # Ensure cutoff is valid
     cutoff_normalized = min(cutoff_normalized, 0.95)
 
-    # 5th order Butterworth lowpass filter
-    b, a = signal.butter(5, cutoff_normalized, btype="low")
+    # 5th order Butterworth lowpass filter, as second-order sections: better
+    # conditioned than (b, a) and designed once per baud/sample rate
+    sos = _butter_lowpass_sos(5, cutoff_normalized)
 
-    # Apply zero-phase filtering to both I and Q
-    i_filtered = signal.filtfilt(b, a, i_samples)
-    q_filtered = signal.filtfilt(b, a, q_samples)
+    # Apply zero-phase filtering to I and Q together. sosfiltfilt runs in
+    # float64 (the SOS coefficients are float64), which keeps the recursive
+    # sections stable; the result is narrowed to float32 once here.
+    filtered = signal.sosfiltfilt(sos, np.stack((i_samples, q_samples)), axis=-1)
+    filtered = filtered.astype(np.float32, copy=False)
 
-    return i_filtered.astype(np.float32), q_filtered.astype(np.float32)
+    return filtered[0], filtered[1]
 
 
 def modulate_to_carrier(
@@ -92,16 +120,28 @@ def modulate_to_carrier(
     Reference:
         Common implementation across PSK, QPSK, PSK8 modems
     """
-    # Generate carrier
     n_samples = len(i_samples)
-    t = np.arange(n_samples) / sample_rate
-    carrier_i = np.cos(2.0 * np.pi * frequency * t)
-    carrier_q = np.sin(2.0 * np.pi * frequency * t)
+    if n_samples == 0:
+        return np.zeros(0, dtype=np.float32)
+
+    # Generate carrier exp(j*w*n) as an outer product of ~sqrt(N) phasors
+    # within a block and ~sqrt(N) block start phasors, so only O(sqrt(N))
+    # sin/cos are evaluated. Each sample is one exact product of two unit
+    # phasors, so there is no recurrence drift. The phasors are evaluated in
+    # double precision and narrowed to complex64, so the N-sample product and
+    # the mixing below run in float32.
+    w = 2.0 * np.pi * frequency / sample_rate
+    block = math.isqrt(n_samples - 1) + 1
+    n_blocks = -(-n_samples // block)
+    within = np.exp(1j * w * np.arange(block)).astype(np.complex64)
+    starts = np.exp(1j * (w * block) * np.arange(n_blocks)).astype(np.complex64)
+    carrier = np.multiply.outer(starts, within).ravel()[:n_samples]
 
-    # Quadrature modulation
-    output = i_samples * carrier_i + q_samples * carrier_q
+    # Quadrature modulation: I*cos(wt) + Q*sin(wt)
+    output = np.asarray(i_samples, dtype=np.float32) * carrier.real
+    output += np.asarray(q_samples, dtype=np.float32) * carrier.imag
 
-    return output.astype(np.float32)
+    return output
 
 
 def normalize_audio(audio: np.ndarray, target_amplitude: float = 0.8) -> np.ndarray:
@@ -115,7 +155,12 @@ def normalize_audio(audio: np.ndarray, target_amplitude: float = 0.8) -> np.ndar
     Returns:
         Normalized audio samples
     """
-    max_amp = np.max(np.abs(audio))
+    audio = np.asarray(audio)
+    # Peak from max/min rather than np.abs(), which would allocate a full copy
+    max_amp = max(float(audio.max()), -float(audio.min()))
     if max_amp > 0:
-        audio = audio / max_amp * target_amplitude
+        # Scale straight into the float32 result: one pass, one allocation
+        out = np.empty(audio.shape, dtype=np.float32)
+        np.multiply(audio, target_amplitude / max_amp, out=out, casting="same_kind")
+        return out
     return audio.astype(np.float32)
@@ -6,20 +6,48 @@ Used in QPSK and other PSK modes with FEC.
 """
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+_MASK64 = (1 << 64) - 1
+
+# Shifts that XOR-fold a 64-bit word down to its parity in the low bit
+_FOLD_SHIFTS = (32, 16, 8, 4, 2, 1)
 
 
 def parity(value: int) -> int:
     """
     Calculate parity (odd number of 1 bits).
 
+    Folds the word onto itself with XORs rather than counting bits
+    through a string.
+
     Args:
-        value: Integer value to calculate parity for
+        value: Non-negative integer value to calculate parity for
 
     Returns:
         0 if even number of 1 bits, 1 if odd number of 1 bits
     """
-    count = bin(value).count("1")
-    return count & 1
+    while value > _MASK64:
+        value = (value & _MASK64) ^ (value >> 64)
+    for shift in _FOLD_SHIFTS:
+        value ^= value >> shift
+    return value & 1
+
+
+def _parity_array(values: np.ndarray) -> np.ndarray:
+    """
+    Element-wise parity of an array of non-negative integers below 2^64.
+
+    Args:
+        values: Integer array
+
+    Returns:
+        uint8 array of 0/1 parities
+    """
+    values = values.astype(np.uint64)
+    for shift in _FOLD_SHIFTS:
+        values ^= values >> np.uint64(shift)
+    return (values & np.uint64(1)).astype(np.uint8)
 
 
 class ConvolutionalEncoder:
@@ -71,11 +99,14 @@ class ConvolutionalEncoder:
         # output[i] contains the 2-bit output for shift register state i
         # Bit 0: parity of (poly1 & state)
         # Bit 1: parity of (poly2 & state)
-        self.output_table = np.zeros(size, dtype=np.uint8)
-        for i in range(size):
-            bit0 = parity(poly1 & i)
-            bit1 = parity(poly2 & i)
-            self.output_table[i] = bit0 | (bit1 << 1)
+        states = np.arange(size, dtype=np.uint64)
+        bit0 = _parity_array(states & np.uint64(poly1))
+        bit1 = _parity_array(states & np.uint64(poly2))
+        self.output_table = bit0 | (bit1 << 1)
+
+        # bytes copy for encode(): indexing bytes gives a plain int rather
+        # than a NumPy scalar
+        self._output_bytes = self.output_table.tobytes()
 
     def encode(self, bit: int) -> int:
         """
@@ -87,11 +118,42 @@ class ConvolutionalEncoder:
         Returns:
             2-bit output symbol (0, 1, 2, or 3) for QPSK
         """
-        # Shift new bit into register
-        self.shreg = (self.shreg << 1) | (1 if bit else 0)
+        # Shift new bit into register, keeping only the k bits the output
+        # depends on so the register does not grow without bound
+        self.shreg = ((self.shreg << 1) | (1 if bit else 0)) & self.shregmask
 
         # Look up output based on current state
-        return self.output_table[self.shreg & self.shregmask]
+        return self._output_bytes[self.shreg]
+
+    def encode_array(self, bits) -> np.ndarray:
+        """
+        Encode a sequence of bits in one pass.
+
+        Equivalent to calling encode() for each bit in turn: the register
+        state after input i is formed from the last k input bits (reaching
+        back into the current register for the first k-1), so all states
+        are built at once from sliding windows over the bit stream.
+
+        Args:
+            bits: Sequence or array of input bits (any non-zero value is 1)
+
+        Returns:
+            uint8 array of 2-bit output symbols, one per input bit
+        """
+        bits = np.asarray(bits) != 0
+        if bits.size == 0:
+            return np.zeros(0, dtype=np.uint8)
+
+        # Register bits that are still in the window, oldest first
+        k = self.k
+        history = np.empty(k - 1 + bits.size, dtype=np.int64)
+        history[: k - 1] = [(self.shreg >> j) & 1 for j in range(k - 2, -1, -1)]
+        history[k - 1 :] = bits
+
+        weights = 1 << np.arange(k - 1, -1, -1, dtype=np.int64)
+        states = sliding_window_view(history, k) @ weights
+        self.shreg = int(states[-1])
+        return self.output_table[states]
 
     def reset(self):
         """Reset the encoder state to zero."""
@@ -112,10 +174,7 @@ class ConvolutionalEncoder:
         if num_bits == 0:
             num_bits = self.k - 1
 
-        outputs = []
-        for _ in range(num_bits):
-            outputs.append(self.encode(0))
-        return outputs
+        return list(self.encode_array(np.zeros(num_bits, dtype=np.uint8)))
 
 
 # Standard encoder configurations
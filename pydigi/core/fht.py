@@ -9,9 +9,28 @@ Original implementation by Pawel Jalocha, December 2004
 """
 
 import numpy as np
+from typing import Optional
 
 
-def fht(data: np.ndarray) -> np.ndarray:
+def _result_buffer(data: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+    """
+    Buffer a transform runs in: a copy of data, or out holding data.
+
+    Args:
+        data: Input array
+        out: Optional destination array (may be data itself)
+
+    Returns:
+        Array holding data that the transform may overwrite
+    """
+    if out is None:
+        return data.copy()
+    if out is not data:
+        np.copyto(out, data)
+    return out
+
+
+def fht(data: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Forward Fast Hadamard Transform.
 
@@ -20,32 +39,37 @@ def fht(data: np.ndarray) -> np.ndarray:
 
     Args:
         data: numpy array of data to transform (length must be power of 2)
+        out: Optional destination array; pass data itself to transform in
+            place and skip the copy
 
     Returns:
-        numpy array containing the transformed data
+        numpy array containing the transformed data (out, if given)
 
     Reference:
         fldigi/src/include/jalocha/pj_fht.h lines 8-27
     """
-    result = data.copy()
+    result = _result_buffer(data, out)
     length = len(result)
 
+    # Each stage is length/2 independent butterflies. Viewing the buffer as
+    # (groups, 2, step) puts every bit1 in [:, 0] and its bit2 in [:, 1].
+    # bit1 is saved to one scratch buffer shared by all stages, and the sums
+    # are written in place, so no stage allocates.
+    scratch = np.empty(length // 2, dtype=result.dtype)
     step = 1
     while step < length:
-        ptr = 0
-        while ptr < length:
-            for ptr2 in range(ptr, ptr + step):
-                bit1 = result[ptr2]
-                bit2 = result[ptr2 + step]
-                result[ptr2] = bit2 + bit1
-                result[ptr2 + step] = bit2 - bit1
-            ptr += 2 * step
+        pairs = result.reshape(-1, 2, step)
+        bit1 = scratch.reshape(-1, step)
+        bit2 = pairs[:, 1]
+        np.copyto(bit1, pairs[:, 0])
+        np.add(bit2, bit1, out=pairs[:, 0])
+        np.subtract(bit2, bit1, out=bit2)
         step *= 2
 
     return result
 
 
-def ifht(data: np.ndarray) -> np.ndarray:
+def ifht(data: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Inverse Fast Hadamard Transform.
 
@@ -54,26 +78,28 @@ def ifht(data: np.ndarray) -> np.ndarray:
 
     Args:
         data: numpy array of data to transform (length must be power of 2)
+        out: Optional destination array; pass data itself to transform in
+            place and skip the copy
 
     Returns:
-        numpy array containing the inverse transformed data
+        numpy array containing the inverse transformed data (out, if given)
 
     Reference:
         fldigi/src/include/jalocha/pj_fht.h lines 29-49
     """
-    result = data.copy()
+    result = _result_buffer(data, out)
     length = len(result)
 
+    # Same stage layout as fht(), run from the widest stage down
+    scratch = np.empty(length // 2, dtype=result.dtype)
     step = length // 2
     while step > 0:
-        ptr = 0
-        while ptr < length:
-            for ptr2 in range(ptr, ptr + step):
-                bit1 = result[ptr2]
-                bit2 = result[ptr2 + step]
-                result[ptr2] = bit1 - bit2
-                result[ptr2 + step] = bit1 + bit2
-            ptr += 2 * step
+        pairs = result.reshape(-1, 2, step)
+        bit1 = scratch.reshape(-1, step)
+        bit2 = pairs[:, 1]
+        np.copyto(bit1, pairs[:, 0])
+        np.subtract(bit1, bit2, out=pairs[:, 0])
+        np.add(bit1, bit2, out=bit2)
         step //= 2
 
     return result
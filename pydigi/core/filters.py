@@ -12,8 +12,17 @@ References:
 """
 
 import numpy as np
+from numpy.typing import DTypeLike
+from scipy import signal
 from typing import Optional, Union
 
+# FIRFilter.filter_array switches from direct-form lfilter to overlap-add FFT
+# convolution for filters longer than _FFT_MIN_TAPS on blocks of at least
+# _FFT_MIN_BLOCK samples; below either bound the FFT setup costs more than
+# the O(taps) per-sample work it saves
+_FFT_MIN_TAPS = 128
+_FFT_MIN_BLOCK = 2048
+
 
 def sinc(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     """
@@ -25,11 +34,8 @@ def sinc(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     Returns:
         sinc(x)
     """
-    # Handle x=0 case to avoid division by zero
-    x = np.asarray(x)
-    result = np.ones_like(x, dtype=float)
-    mask = x != 0
-    result[mask] = np.sin(np.pi * x[mask]) / (np.pi * x[mask])
+    # np.sinc is the normalized sinc with sinc(0) = 1, handled in one C loop
+    result = np.sinc(np.asarray(x, dtype=float))
     return result if result.shape else float(result)
 
 
@@ -45,10 +51,11 @@ def cosc(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     Returns:
         cosc(x)
     """
-    x = np.asarray(x)
-    result = np.ones_like(x, dtype=float)
-    mask = x != 0
-    result[mask] = np.cos(np.pi * x[mask]) / (np.pi * x[mask])
+    # x=0 is defined as 1; dividing by 1 there keeps the division finite
+    # without gathering and scattering through a boolean mask
+    x = np.asarray(x, dtype=float)
+    zero = x == 0
+    result = np.where(zero, 1.0, np.cos(np.pi * x) / (np.pi * np.where(zero, 1.0, x)))
     return result if result.shape else float(result)
 
 
@@ -108,6 +115,41 @@ def raised_cosine(t: np.ndarray, symbol_rate: float, alpha: float = 0.5) -> np.n
     return result
 
 
+def _design_grid(length: int):
+    """
+    Tap positions for the windowed FIR designs.
+
+    Args:
+        length: Filter length (number of taps)
+
+    Returns:
+        Tuple of (t, h): tap offsets from the filter centre, and the same
+        positions scaled to [0, 1] for the window functions
+    """
+    i = np.arange(length, dtype=np.float64)
+    return i - (length - 1.0) / 2.0, i / (length - 1.0)
+
+
+def _apply_window(taps: np.ndarray, h: np.ndarray, window: str) -> np.ndarray:
+    """
+    Multiply design taps by the named window, in place.
+
+    Args:
+        taps: Unwindowed taps
+        h: Tap positions scaled to [0, 1]
+        window: Window function ('hamming' or 'blackman'; anything else
+            leaves the taps unwindowed)
+
+    Returns:
+        taps
+    """
+    if window == "hamming":
+        taps *= hamming(h)
+    elif window == "blackman":
+        taps *= blackman(h)
+    return taps
+
+
 class FIRFilter:
     """
     Finite Impulse Response (FIR) filter with decimation support.
@@ -121,23 +163,30 @@ class FIRFilter:
         length: Filter length (number of taps)
         decimation: Decimation ratio (output every Nth sample)
         taps: Filter coefficients
+        dtype: Complex sample type of filter_array() input and output
     """
 
-    def __init__(self, taps: np.ndarray, decimation: int = 1):
+    def __init__(self, taps: np.ndarray, decimation: int = 1, dtype: DTypeLike = np.complex128):
         """
         Initialize the FIR filter.
 
         Args:
             taps: Filter coefficients (impulse response)
             decimation: Decimation ratio (default: 1, no decimation)
+            dtype: Complex sample type (default: np.complex128). np.complex64
+                halves the memory traffic; its 24-bit mantissa still leaves
+                plenty of headroom over 16-bit audio.
         """
         self.length = len(taps)
         self.decimation = decimation
-        self.taps = np.asarray(taps, dtype=np.float64)
+        self.dtype = np.dtype(dtype)
+        real_dtype = np.finfo(self.dtype).dtype
+        self.taps = np.asarray(taps, dtype=real_dtype)
+        self.use_fft = self.length > _FFT_MIN_TAPS
 
         # Circular buffers for I and Q
-        self.buffer_i = np.zeros(self.length, dtype=np.float64)
-        self.buffer_q = np.zeros(self.length, dtype=np.float64)
+        self.buffer_i = np.zeros(self.length, dtype=real_dtype)
+        self.buffer_q = np.zeros(self.length, dtype=real_dtype)
 
         # Buffer pointer and decimation counter
         self.pointer = 0
@@ -192,12 +241,55 @@ class FIRFilter:
         Returns:
             Array of filtered samples (length may be reduced by decimation)
         """
-        output = []
-        for sample in samples:
-            result = self.filter(sample)
-            if result is not None:
-                output.append(result)
-        return np.array(output, dtype=np.complex128)
+        samples = np.asarray(samples, dtype=self.dtype)
+        n = len(samples)
+        if n == 0:
+            return np.zeros(0, dtype=self.dtype)
+        length = self.length
+
+        decimation = self.decimation
+        # Block index of the first output filter() would return
+        first = decimation - 1 - self.counter
+
+        # The buffered inputs, newest first, carry the output on from
+        # earlier filter()/filter_array() calls
+        past = (self.pointer - 1 - np.arange(length - 1)) % length
+        history = np.empty(length - 1, dtype=self.dtype)
+        history.real = self.buffer_i[past]
+        history.imag = self.buffer_q[past]
+
+        if decimation == 1 and self.use_fft and n >= _FFT_MIN_BLOCK:
+            # Long filter: overlap-add FFT convolution. The history supplies
+            # the overlap, so 'valid' mode yields exactly the n outputs that
+            # continue the stream - no block-boundary transient.
+            extended = np.concatenate((history[::-1], samples))
+            output = signal.oaconvolve(extended, self.taps, mode="valid")
+        elif decimation == 1:
+            # Denominator in the taps' precision, so complex64 stays complex64
+            a = np.ones(1, dtype=self.taps.dtype)
+            zi = signal.lfiltic(self.taps, a, [], history).astype(self.dtype)
+            output, _ = signal.lfilter(self.taps, a, samples, zi=zi)
+        else:
+            # Polyphase decimation: upfirdn only computes the kept outputs.
+            # Output k of the block is index k + length - 1 of the full
+            # convolution over history + samples; zero padding in front puts
+            # the first kept one on a multiple of the decimation ratio.
+            offset = first + length - 1
+            pad = -offset % decimation
+            extended = np.concatenate((np.zeros(pad, dtype=self.dtype), history[::-1], samples))
+            start = (offset + pad) // decimation
+            count = len(range(first, n, decimation))
+            output = signal.upfirdn(self.taps, extended, down=decimation)[start : start + count]
+
+        # Advance the circular buffers and decimation counter past the block
+        keep = min(n, length)
+        pos = (self.pointer + np.arange(n - keep, n)) % length
+        self.buffer_i[pos] = samples.real[-keep:]
+        self.buffer_q[pos] = samples.imag[-keep:]
+        self.pointer = (self.pointer + n) % length
+        self.counter = (self.counter + n) % self.decimation
+
+        return output
 
     @staticmethod
     def design_lowpass(length: int, cutoff: float, window: str = "hamming") -> "FIRFilter":
@@ -212,23 +304,12 @@ class FIRFilter:
         Returns:
             FIRFilter instance
         """
-        taps = np.zeros(length)
-
-        for i in range(length):
-            t = i - (length - 1.0) / 2.0
-            h = i / (length - 1.0)
+        t, h = _design_grid(length)
 
-            # Windowed sinc lowpass
-            x = 2.0 * cutoff * sinc(2.0 * cutoff * t)
+        # Windowed sinc lowpass
+        taps = 2.0 * cutoff * sinc(2.0 * cutoff * t)
 
-            if window == "hamming":
-                x *= hamming(h)
-            elif window == "blackman":
-                x *= blackman(h)
-
-            taps[i] = x
-
-        return FIRFilter(taps)
+        return FIRFilter(_apply_window(taps, h, window))
 
     @staticmethod
     def design_bandpass(
@@ -246,23 +327,12 @@ class FIRFilter:
         Returns:
             FIRFilter instance
         """
-        taps = np.zeros(length)
-
-        for i in range(length):
-            t = i - (length - 1.0) / 2.0
-            h = i / (length - 1.0)
-
-            # Windowed sinc bandpass (difference of two lowpass filters)
-            x = 2.0 * f_high * sinc(2.0 * f_high * t) - 2.0 * f_low * sinc(2.0 * f_low * t)
+        t, h = _design_grid(length)
 
-            if window == "hamming":
-                x *= hamming(h)
-            elif window == "blackman":
-                x *= blackman(h)
+        # Windowed sinc bandpass (difference of two lowpass filters)
+        taps = 2.0 * f_high * sinc(2.0 * f_high * t) - 2.0 * f_low * sinc(2.0 * f_low * t)
 
-            taps[i] = x
-
-        return FIRFilter(taps)
+        return FIRFilter(_apply_window(taps, h, window))
 
     @staticmethod
     def design_hilbert(
@@ -282,26 +352,15 @@ class FIRFilter:
         Returns:
             FIRFilter instance
         """
-        taps = np.zeros(length)
-
-        for i in range(length):
-            t = i - (length - 1.0) / 2.0
-            h = i / (length - 1.0)
-
-            # Windowed cosc for Hilbert transform
-            x = 2.0 * f_high * cosc(2.0 * f_high * t) - 2.0 * f_low * cosc(2.0 * f_low * t)
+        t, h = _design_grid(length)
 
-            # Time reversal for actual filter
-            x = -x
+        # Windowed cosc for Hilbert transform
+        taps = 2.0 * f_high * cosc(2.0 * f_high * t) - 2.0 * f_low * cosc(2.0 * f_low * t)
 
-            if window == "hamming":
-                x *= hamming(h)
-            elif window == "blackman":
-                x *= blackman(h)
+        # Time reversal for actual filter
+        taps = -taps
 
-            taps[i] = x
-
-        return FIRFilter(taps)
+        return FIRFilter(_apply_window(taps, h, window))
 
 
 class MovingAverageFilter:
@@ -311,15 +370,18 @@ class MovingAverageFilter:
     Simple and efficient filter for smoothing signals.
     """
 
-    def __init__(self, length: int):
+    def __init__(self, length: int, dtype: DTypeLike = np.complex128):
         """
         Initialize the moving average filter.
 
         Args:
             length: Number of samples to average
+            dtype: Complex sample type (default: np.complex128, or
+                np.complex64 for a single-precision pipeline)
         """
         self.length = length
-        self.buffer = np.zeros(length, dtype=np.complex128)
+        self.dtype = np.dtype(dtype)
+        self.buffer = np.zeros(length, dtype=self.dtype)
         self.pointer = 0
         self.sum = 0.0 + 0.0j
 
@@ -360,10 +422,29 @@ class MovingAverageFilter:
         Returns:
             Array of filtered samples
         """
-        output = np.zeros(len(samples), dtype=np.complex128)
-        for i, sample in enumerate(samples):
-            output[i] = self.filter(sample)
-        return output
+        samples = np.asarray(samples, dtype=self.dtype)
+        n = len(samples)
+        if n == 0:
+            return np.zeros(0, dtype=self.dtype)
+        length = self.length
+        pointer = self.pointer
+
+        # The sample leaving the window as each new one arrives: first the
+        # buffered samples oldest first, then the block itself
+        leaving = np.concatenate((self.buffer[pointer:], self.buffer[:pointer], samples))[:n]
+
+        # Running sum as a cumulative sum of (arriving - leaving), continuing
+        # from the current sum
+        sums = np.cumsum(samples - leaving)
+        sums += self.dtype.type(self.sum)
+
+        keep = min(n, length)
+        self.buffer[(pointer + np.arange(n - keep, n)) % length] = samples[n - keep :]
+        self.pointer = (pointer + n) % length
+        self.sum = complex(sums[-1])
+
+        sums /= length
+        return sums
 
 
 class GoertzelFilter:
@@ -393,6 +474,9 @@ class GoertzelFilter:
         self.coeff = 2.0 * np.cos(w)
         self.w = w
 
+        # The recursion as an IIR denominator, for filter_array()
+        self._denominator = np.array([1.0, -self.coeff, 1.0])
+
         self.reset()
 
     def reset(self) -> None:
@@ -421,9 +505,7 @@ class GoertzelFilter:
 
         if self.count >= self.n_samples:
             # Compute magnitude squared
-            real = self.s1 - self.s2 * np.cos(self.w)
-            imag = self.s2 * np.sin(self.w)
-            magnitude_sq = real * real + imag * imag
+            magnitude_sq = self._magnitude_sq(self.s1, self.s2)
 
             # Reset for next block
             self.reset()
@@ -431,3 +513,72 @@ class GoertzelFilter:
             return magnitude_sq
 
         return None
+
+    def filter_array(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Process an array of samples.
+
+        The recursion is the two-pole IIR 1 / (1 - coeff*z^-1 + z^-2), so each
+        block runs through lfilter in C; complete blocks are filtered
+        together as rows of one 2-D call.
+
+        Args:
+            samples: Array of real samples
+
+        Returns:
+            Array of magnitude squared values, one per completed block
+        """
+        samples = np.asarray(samples, dtype=np.float64)
+        block = self.n_samples
+        outputs = []
+
+        # Finish the block already in progress
+        head = min(len(samples), block - self.count)
+        if head:
+            self._run(samples[:head])
+            if self.count >= block:
+                outputs.append(self._magnitude_sq(self.s1, self.s2))
+                self.reset()
+        rest = samples[head:]
+
+        # Whole blocks, each starting from a zero state
+        full = len(rest) - len(rest) % block
+        if full:
+            y = signal.lfilter([1.0], self._denominator, rest[:full].reshape(-1, block), axis=-1)
+            s2 = y[:, -2] if block > 1 else 0.0
+            outputs.extend(self._magnitude_sq(y[:, -1], s2).tolist())
+
+        # Start the next block with what is left
+        if full < len(rest):
+            self._run(rest[full:])
+
+        return np.array(outputs, dtype=np.float64)
+
+    def _run(self, samples: np.ndarray) -> None:
+        """
+        Advance the recursion over samples that stay within one block.
+
+        Args:
+            samples: Real samples, at most n_samples - count of them
+        """
+        a = self._denominator
+        zi = signal.lfiltic([1.0], a, [self.s1, self.s2])
+        y, _ = signal.lfilter([1.0], a, samples, zi=zi)
+        self.s2 = float(y[-2]) if len(y) > 1 else self.s1
+        self.s1 = float(y[-1])
+        self.count += len(y)
+
+    def _magnitude_sq(self, s1, s2):
+        """
+        Magnitude squared at the target frequency from the final state.
+
+        Args:
+            s1: Last recursion output (scalar or array)
+            s2: Output before it (scalar or array)
+
+        Returns:
+            real^2 + imag^2 of the DFT bin
+        """
+        real = s1 - s2 * np.cos(self.w)
+        imag = s2 * np.sin(self.w)
+        return real * real + imag * imag
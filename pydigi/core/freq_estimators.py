@@ -160,6 +160,148 @@ def jacobsen_estimator(
     return delta
 
 
+def _neighbour_bins(
+    values: np.ndarray,
+    peak_bins: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gather the bins on and either side of each peak, for the batch estimators.
+
+    Args:
+        values: FFT array (magnitude or complex)
+        peak_bins: Array of peak bin indices
+
+    Returns:
+        Tuple of (valid, below, peak, above)
+        valid: True where the peak has a bin on both sides
+        below, peak, above: values at peak_bins - 1, peak_bins and
+        peak_bins + 1 (edge peaks read an arbitrary bin; mask with valid)
+    """
+    values = np.asarray(values)
+    peak_bins = np.asarray(peak_bins, dtype=np.intp)
+    valid = (peak_bins > 0) & (peak_bins < len(values) - 1)
+
+    if len(values) < 3:
+        # No bin has neighbours on both sides
+        empty = np.zeros(peak_bins.shape, dtype=values.dtype)
+        return valid, empty, empty, empty
+
+    # Edge peaks are moved inside so the gathers stay in bounds
+    centre = np.where(valid, peak_bins, 1)
+    return valid, values[centre - 1], values[centre], values[centre + 1]
+
+
+def _clamp_offsets(delta: np.ndarray) -> np.ndarray:
+    """
+    Clamp bin offsets to [-0.5, 0.5] as the scalar estimators do.
+
+    fmin/fmax skip a NaN operand, so a NaN offset becomes 0.5 just as
+    max(-0.5, min(0.5, nan)) does.
+
+    Args:
+        delta: Array of bin offsets
+
+    Returns:
+        Clamped offsets
+    """
+    return np.fmax(-0.5, np.fmin(0.5, delta))
+
+
+def parabolic_interpolation_batch(
+    fft_mag: np.ndarray,
+    peak_bins: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parabolic interpolation for many peaks at once.
+
+    Same as parabolic_interpolation() applied to each peak, with the
+    arithmetic done on whole arrays.
+
+    Args:
+        fft_mag: FFT magnitude array (linear scale)
+        peak_bins: Array of peak bin indices
+
+    Returns:
+        Tuple of (bin_offsets, magnitude_corrections) arrays, one entry
+        per peak; edge and flat peaks give offset 0.0 and correction 1.0
+    """
+    valid, alpha, beta, gamma = _neighbour_bins(fft_mag, peak_bins)
+
+    denom = alpha - 2*beta + gamma
+    valid &= np.abs(denom) >= 1e-10
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p = 0.5 * (alpha - gamma) / denom
+    p = _clamp_offsets(p)
+    mag_correction = beta - 0.25 * (alpha - gamma) * p
+
+    return np.where(valid, p, 0.0), np.where(valid, mag_correction, 1.0)
+
+
+def quinn_estimator_batch(
+    fft_bins: np.ndarray,
+    peak_bins: np.ndarray
+) -> np.ndarray:
+    """
+    Quinn's first estimator for many peaks at once.
+
+    Same as quinn_estimator() applied to each peak; quinn_tau() works
+    element-wise on the complex bin ratios.
+
+    Args:
+        fft_bins: Complex FFT array
+        peak_bins: Array of peak bin indices
+
+    Returns:
+        Array of fractional bin offsets (0.0 for edge or empty peaks)
+    """
+    valid, y_minus, y_0, y_plus = _neighbour_bins(fft_bins, peak_bins)
+    valid &= np.abs(y_0) >= 1e-10
+
+    # Invalid peaks may divide by zero; their results are discarded
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tau_minus = quinn_tau(y_minus / y_0)
+        tau_plus = quinn_tau(y_plus / y_0)
+        delta = (tau_plus - tau_minus) / (1 + tau_plus + tau_minus)
+
+    return np.where(valid, _clamp_offsets(delta), 0.0)
+
+
+def jacobsen_estimator_batch(
+    fft_bins: np.ndarray,
+    peak_bins: np.ndarray
+) -> np.ndarray:
+    """
+    Jacobsen's estimator for many peaks at once.
+
+    Same as jacobsen_estimator() applied to each peak, with the
+    arithmetic done on whole arrays.
+
+    Args:
+        fft_bins: Complex FFT array
+        peak_bins: Array of peak bin indices
+
+    Returns:
+        Array of fractional bin offsets (0.0 for edge or empty peaks)
+    """
+    valid, y_minus, y_0, y_plus = _neighbour_bins(fft_bins, peak_bins)
+    valid &= np.abs(y_0) >= 1e-10
+
+    # Invalid peaks may divide by zero; their results are discarded
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta_minus = y_minus / y_0
+        delta_plus = y_plus / y_0
+
+        # Use whichever neighbour has the larger magnitude
+        delta = np.where(
+            np.abs(delta_plus) > np.abs(delta_minus),
+            delta_plus.real / (1 + delta_plus.real),
+            -delta_minus.real / (1 + delta_minus.real)
+        )
+
+    return np.where(valid, _clamp_offsets(delta), 0.0)
+
+
 def phase_vocoder_estimator(
     fft1: np.ndarray,
     fft2: np.ndarray,
@@ -42,12 +42,9 @@ def hamming_weight_16(n: int) -> int:
     Returns:
         Number of 1 bits in the integer
     """
-    count = 0
-    n = n & 0xFFFF
-    while n:
-        n &= n - 1
-        count += 1
-    return count
+    # One C-level count rather than a Python iteration per set bit;
+    # int.bit_count() would need Python 3.10
+    return bin(n & 0xFFFF).count("1")
 
 
 def hamming_weight_30(n: int) -> int:
@@ -60,12 +57,33 @@ def hamming_weight_30(n: int) -> int:
     Returns:
         Number of 1 bits in the integer
     """
-    count = 0
-    n = n & 0x3FFFFFFF
-    while n:
-        n &= n - 1
-        count += 1
-    return count
+    return bin(n & 0x3FFFFFFF).count("1")
+
+
+def _build_parity_table() -> Tuple[int, ...]:
+    """
+    Build the parity word of every 12-bit data word.
+
+    Entry d is the XOR of the GOLAY_MATRIX rows selected by the bits of d,
+    with bit 0 selecting the last row.
+
+    Returns:
+        Tuple of 4096 12-bit parity words, indexed by data word
+    """
+    rows = [int(row) for row in GOLAY_MATRIX]
+    table = []
+    for data in range(4096):
+        parity = 0
+        for i in range(11, -1, -1):
+            if data & 1:
+                parity ^= rows[i]
+            data >>= 1
+        table.append(parity & 0xFFF)
+    return tuple(table)
+
+
+# Parity of every data word, so golay_mult() is a single lookup
+_GOLAY_PARITY = _build_parity_table()
 
 
 def golay_mult(data: int) -> int:
@@ -81,15 +99,46 @@ def golay_mult(data: int) -> int:
     Returns:
         12-bit parity word
     """
-    parity = 0
-    data = data & 0xFFF
+    return _GOLAY_PARITY[data & 0xFFF]
 
-    for i in range(11, -1, -1):
-        if data & 1:
-            parity ^= int(GOLAY_MATRIX[i])
-        data >>= 1
 
-    return parity & 0xFFF
+def _build_bit_flip_tables() -> Tuple[tuple, tuple]:
+    """
+    Build the outcome of golay_decode()'s single-bit-flip searches.
+
+    Both searches XOR a 12-bit syndrome with each GOLAY_MATRIX row in turn
+    (last row first) and stop at the first result of weight 2 or less, so
+    their outcome depends on the syndrome alone and can be tabulated.
+
+    Returns:
+        Tuple (data_bit_table, parity_bit_table) of 4096-entry tuples indexed
+        by syndrome, each entry (data_error_mask, bit_errors) or None:
+        - data_bit_table: one data bit and up to two parity bits in error
+          (Case 3), indexed by the syndrome
+        - parity_bit_table: one parity bit and up to two data bits in error
+          (Case 4), indexed by the parity syndrome
+    """
+    rows = [int(row) for row in GOLAY_MATRIX]
+    data_bit_table = []
+    parity_bit_table = []
+    for syndrome in range(4096):
+        data_bit = None
+        parity_bit = None
+        for i in range(11, -1, -1):
+            test_syndrome = syndrome ^ rows[i]
+            bit_errors = hamming_weight_16(test_syndrome)
+            if bit_errors <= 2:
+                if data_bit is None:
+                    data_bit = (0x800 >> i, bit_errors + 1)
+                if parity_bit is None:
+                    parity_bit = (test_syndrome, bit_errors + 1)
+        data_bit_table.append(data_bit)
+        parity_bit_table.append(parity_bit)
+    return tuple(data_bit_table), tuple(parity_bit_table)
+
+
+# Case 3 and Case 4 corrections of golay_decode(), by syndrome
+_DATA_BIT_FLIPS, _PARITY_BIT_FLIPS = _build_bit_flip_tables()
 
 
 def golay_encode(data: int) -> int:
@@ -155,25 +204,21 @@ def golay_decode(codeword: int) -> Tuple[int, int]:
         return corrected_data & 0xFFF, bit_errors
 
     # Case 3: Try flipping each data bit to see if we have 2 or fewer errors
-    for i in range(11, -1, -1):
-        test_syndrome = syndrome ^ int(GOLAY_MATRIX[i])
-        bit_errors = hamming_weight_16(test_syndrome)
-        if bit_errors <= 2:
-            corrected_data = data ^ (0x800 >> i)
-            return corrected_data & 0xFFF, bit_errors + 1
-
     # Case 4: Try flipping each parity bit to see if we have 2 or fewer errors
-    for i in range(11, -1, -1):
-        par_bit_synd = parity_syndrome ^ int(GOLAY_MATRIX[i])
-        bit_errors = hamming_weight_16(par_bit_synd)
-        if bit_errors <= 2:
-            corrected_data = data ^ par_bit_synd
-            return corrected_data & 0xFFF, bit_errors + 1
+    # Both searches are precomputed per syndrome; Case 3 takes precedence
+    correction = _DATA_BIT_FLIPS[syndrome] or _PARITY_BIT_FLIPS[parity_syndrome]
+    if correction is not None:
+        data_error, bit_errors = correction
+        return data ^ data_error, bit_errors
 
     # Uncorrectable error
     return 0xFFFF, 99
 
 
+# Bit 3 of each of the six 5-bit fields of a SCAMP frame
+_GROUP_BIT3_MASK = 0x10842108
+
+
 def add_reversal_bits(codeword: int) -> int:
     """
     Add reversal bits to a 24-bit Golay codeword to create a 30-bit SCAMP frame.
@@ -198,21 +243,21 @@ def add_reversal_bits(codeword: int) -> int:
         >>> bin(frame)  # 30-bit frame
     """
     codeword = codeword & 0xFFFFFF
-    outword = 0
 
-    for i in range(6):
-        if i > 0:
-            outword <<= 5
-        codeword <<= 4
-
-        # Extract the top 4 bits
-        temp = (codeword >> 24) & 0x0F
-
-        # Insert reversal bit (complement of bit 3)
-        # temp format: [b3 b2 b1 b0]
-        # output format: [b3 b2 b1 ~b3 b0]
-        reversal_bit = ((temp & 0x08) ^ 0x08) << 1
-        outword |= temp | reversal_bit
+    # Spread the six 4-bit groups out to 5-bit fields: group g moves from
+    # bit 4g to bit 5g, leaving bit 5g+4 of each field clear
+    outword = (
+        (codeword & 0xF)
+        | ((codeword << 1) & 0x1E0)
+        | ((codeword << 2) & 0x3C00)
+        | ((codeword << 3) & 0x78000)
+        | ((codeword << 4) & 0xF00000)
+        | ((codeword << 5) & 0x1E000000)
+    )
+
+    # Insert reversal bits (complement of bit 3) into every field at once:
+    # each field [b3 b2 b1 b0] becomes [~b3 b3 b2 b1 b0]
+    outword |= (~outword & _GROUP_BIT3_MASK) << 1
 
     return outword & 0x3FFFFFFF
 
@@ -238,20 +283,18 @@ def remove_reversal_bits(frame: int) -> int:
         >>> hex(codeword)  # 24-bit codeword
     """
     frame = frame & 0x3FFFFFFF
-    codeword = 0
-
-    for i in range(6):
-        if i > 0:
-            frame <<= 5
-            codeword <<= 4
 
-        # Extract the top 5 bits and keep only the data bits
-        # Input: [b3 b2 b1 ~b3 b0]
-        # Output: [b3 b2 b1 b0]
-        temp = (frame >> 25) & 0x0F
-        codeword |= temp
-
-    return codeword & 0xFFFFFF
+    # Keep the low 4 bits of each 5-bit field, packing field g at bit 4g
+    codeword = (
+        (frame & 0xF)
+        | ((frame >> 1) & 0xF0)
+        | ((frame >> 2) & 0xF00)
+        | ((frame >> 3) & 0xF000)
+        | ((frame >> 4) & 0xF0000)
+        | ((frame >> 5) & 0xF00000)
+    )
+
+    return codeword
 
 
 # SCAMP special frame codewords (30-bit values with reversal bits)
@@ -43,26 +43,19 @@ class Interleave:
         self.direction = direction
         self.len = size * size * depth
 
-        # Create 3D table as a flat array
+        # Create 3D table as a flat array, with a (depth, size, size) view of
+        # it; table3d[i, j, k] is fldigi's tab(i, j, k)
+        # (fldigi/src/include/interleave.h lines 41-43)
         self.table = np.zeros(self.len, dtype=np.uint8)
+        self.table3d = self.table.reshape(depth, size, size)
         self.flush()
 
-    def _tab(self, i, j, k):
-        """
-        Access the 3D table at position (i, j, k).
-
-        Args:
-            i: Depth index (0 to depth-1)
-            j: Row index (0 to size-1)
-            k: Column index (0 to size-1)
-
-        Returns:
-            Index into flat table array
-
-        Reference:
-            fldigi/src/include/interleave.h lines 41-43
-        """
-        return (self.size * self.size * i) + (self.size * j) + k
+        # Row and column of each symbol's diagonal cell, anti-diagonal for TX
+        self._diag_rows = np.arange(size)
+        if direction == INTERLEAVE_FWD:
+            self._diag_cols = self._diag_rows[::-1].copy()
+        else:
+            self._diag_cols = self._diag_rows.copy()
 
     def symbols(self, psyms: np.ndarray) -> None:
         """
@@ -74,26 +67,21 @@ class Interleave:
         Reference:
             fldigi/src/mfsk/interleave.cxx lines 57-76
         """
-        for k in range(self.depth):
-            # Shift columns left
-            for i in range(self.size):
-                for j in range(self.size - 1):
-                    idx_src = self._tab(k, i, j + 1)
-                    idx_dst = self._tab(k, i, j)
-                    self.table[idx_dst] = self.table[idx_src]
+        table = self.table3d
+        rows = self._diag_rows
+        cols = self._diag_cols
+
+        # Shift columns left; this does not depend on the symbols, so every
+        # layer is shifted at once
+        table[:, :, :-1] = table[:, :, 1:]
 
+        # Each layer's output feeds the next, so only the depth loop remains
+        for k in range(self.depth):
             # Insert new symbols at rightmost column
-            for i in range(self.size):
-                idx = self._tab(k, i, self.size - 1)
-                self.table[idx] = psyms[i]
+            table[k, :, -1] = psyms
 
             # Extract symbols diagonally
-            for i in range(self.size):
-                if self.direction == INTERLEAVE_FWD:
-                    idx = self._tab(k, i, self.size - i - 1)
-                else:
-                    idx = self._tab(k, i, i)
-                psyms[i] = self.table[idx]
+            psyms[:] = table[k, rows, cols]
 
     def bits(self, pbits: int) -> int:
         """
@@ -103,8 +103,8 @@ class MFSKEncoder:
         else:
             self.fht_buffer[char - self.symbols_per_block] = -1
 
-        # Apply inverse FHT
-        self.fht_buffer = ifht(self.fht_buffer).astype(np.int8)
+        # Apply inverse FHT in place (a single +/-1 input stays within int8)
+        ifht(self.fht_buffer, out=self.fht_buffer)
 
     def _scramble_fht(self, code_offset=0):
         """
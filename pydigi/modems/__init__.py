@@ -1,186 +1,135 @@
-"""Digital modem implementations."""
+"""Digital modem implementations.
 
-from .cw import CW
-from .rtty import RTTY
-from .psk import PSK, PSK31, PSK63, PSK125, PSK250, PSK500
-from .psk_decoder import PSKDecoder
-from .qpsk import QPSK, QPSK31, QPSK63, QPSK125, QPSK250, QPSK500
-from .psk8 import EightPSK, EightPSK_125, EightPSK_250, EightPSK_500, EightPSK_1000
-from .psk8_fec import (
-    EightPSKFEC,
-    EightPSK_125F,
-    EightPSK_125FL,
-    EightPSK_250F,
-    EightPSK_250FL,
-    EightPSK_500F,
-    EightPSK_1000F,
-    EightPSK_1200F,
-)
-from .olivia import (
-    Olivia,
-    Olivia4_125,
-    Olivia8_250,
-    Olivia8_500,
-    Olivia16_500,
-    Olivia16_1000,
-    Olivia32_1000,
-)
-from .contestia import (
-    Contestia,
-    Contestia4_125,
-    Contestia4_250,
-    Contestia8_125,
-    Contestia8_250,
-    Contestia8_500,
-    Contestia16_500,
-    Contestia32_1000,
-)
-from .mfsk import MFSK, MFSK8, MFSK16, MFSK32, MFSK64, MFSK128
-from .hell import Hell, FeldHell, SlowHell, HellX5, HellX9, FSKHell245, FSKHell105, Hell80
-from .dominoex import (
-    DominoEX,
-    DominoEX_Micro,
-    DominoEX_4,
-    DominoEX_5,
-    DominoEX_8,
-    DominoEX_11,
-    DominoEX_16,
-    DominoEX_22,
-    DominoEX_44,
-    DominoEX_88,
-)
-from .fsq import FSQ, FSQ_2, FSQ_3, FSQ_6
-from .thor import (
-    Thor,
-    ThorMicro,
-    Thor4,
-    Thor5,
-    Thor8,
-    Thor11,
-    Thor16,
-    Thor22,
-    Thor25,
-    Thor32,
-    Thor44,
-    Thor56,
-    Thor25x4,
-    Thor50x1,
-    Thor50x2,
-    Thor100,
-)
-from .throb import Throb, Throb1, Throb2, Throb4, ThrobX1, ThrobX2, ThrobX4
-from .ifkp import IFKP, create_ifkp_modem
-from .scamp import SCAMP, SCAMPFSK, SCAMPOOK, SCFSKFST, SCFSKSLW, SCOOKSLW, SCFSKVSL
-from .navtex import NAVTEX, SITORB
-from .wefax import WEFAX, WEFAX576, WEFAX288
+Modem classes are imported lazily (PEP 562) so that importing one mode, e.g.
+``from pydigi.modems import WEFAX576``, doesn't load every other modem.
+"""
 
-__all__ = [
-    "CW",
-    "RTTY",
-    "PSK",
-    "PSK31",
-    "PSK63",
-    "PSK125",
-    "PSK250",
-    "PSK500",
-    "PSKDecoder",
-    "QPSK",
-    "QPSK31",
-    "QPSK63",
-    "QPSK125",
-    "QPSK250",
-    "QPSK500",
-    "EightPSK",
-    "EightPSK_125",
-    "EightPSK_250",
-    "EightPSK_500",
-    "EightPSK_1000",
-    "EightPSKFEC",
-    "EightPSK_125F",
-    "EightPSK_125FL",
-    "EightPSK_250F",
-    "EightPSK_250FL",
-    "EightPSK_500F",
-    "EightPSK_1000F",
-    "EightPSK_1200F",
-    "Olivia",
-    "Olivia4_125",
-    "Olivia8_250",
-    "Olivia8_500",
-    "Olivia16_500",
-    "Olivia16_1000",
-    "Olivia32_1000",
-    "Contestia",
-    "Contestia4_125",
-    "Contestia4_250",
-    "Contestia8_125",
-    "Contestia8_250",
-    "Contestia8_500",
-    "Contestia16_500",
-    "Contestia32_1000",
-    "MFSK",
-    "MFSK8",
-    "MFSK16",
-    "MFSK32",
-    "MFSK64",
-    "MFSK128",
-    "Hell",
-    "FeldHell",
-    "SlowHell",
-    "HellX5",
-    "HellX9",
-    "FSKHell245",
-    "FSKHell105",
-    "Hell80",
-    "DominoEX",
-    "DominoEX_Micro",
-    "DominoEX_4",
-    "DominoEX_5",
-    "DominoEX_8",
-    "DominoEX_11",
-    "DominoEX_16",
-    "DominoEX_22",
-    "DominoEX_44",
-    "DominoEX_88",
-    "FSQ",
-    "FSQ_2",
-    "FSQ_3",
-    "FSQ_6",
-    "Thor",
-    "ThorMicro",
-    "Thor4",
-    "Thor5",
-    "Thor8",
-    "Thor11",
-    "Thor16",
-    "Thor22",
-    "Thor25",
-    "Thor32",
-    "Thor44",
-    "Thor56",
-    "Thor25x4",
-    "Thor50x1",
-    "Thor50x2",
-    "Thor100",
-    "Throb",
-    "Throb1",
-    "Throb2",
-    "Throb4",
-    "ThrobX1",
-    "ThrobX2",
-    "ThrobX4",
-    "IFKP",
-    "create_ifkp_modem",
-    "SCAMP",
-    "SCAMPFSK",
-    "SCAMPOOK",
-    "SCFSKFST",
-    "SCFSKSLW",
-    "SCOOKSLW",
-    "SCFSKVSL",
-    "NAVTEX",
-    "SITORB",
-    "WEFAX",
-    "WEFAX576",
-    "WEFAX288",
-]
+import importlib
+
+# Lazily imported exports, grouped by the module that defines them
+_LAZY_MODULES = {
+    ".cw": ("CW",),
+    ".rtty": ("RTTY",),
+    ".psk": ("PSK", "PSK31", "PSK63", "PSK125", "PSK250", "PSK500"),
+    ".psk_decoder": ("PSKDecoder",),
+    ".qpsk": ("QPSK", "QPSK31", "QPSK63", "QPSK125", "QPSK250", "QPSK500"),
+    ".psk8": ("EightPSK", "EightPSK_125", "EightPSK_250", "EightPSK_500", "EightPSK_1000"),
+    ".psk8_fec": (
+        "EightPSKFEC",
+        "EightPSK_125F",
+        "EightPSK_125FL",
+        "EightPSK_250F",
+        "EightPSK_250FL",
+        "EightPSK_500F",
+        "EightPSK_1000F",
+        "EightPSK_1200F",
+    ),
+    ".olivia": (
+        "Olivia",
+        "Olivia4_125",
+        "Olivia8_250",
+        "Olivia8_500",
+        "Olivia16_500",
+        "Olivia16_1000",
+        "Olivia32_1000",
+    ),
+    ".contestia": (
+        "Contestia",
+        "Contestia4_125",
+        "Contestia4_250",
+        "Contestia8_125",
+        "Contestia8_250",
+        "Contestia8_500",
+        "Contestia16_500",
+        "Contestia32_1000",
+    ),
+    ".mfsk": ("MFSK", "MFSK8", "MFSK16", "MFSK32", "MFSK64", "MFSK128"),
+    ".hell": (
+        "Hell",
+        "FeldHell",
+        "SlowHell",
+        "HellX5",
+        "HellX9",
+        "FSKHell245",
+        "FSKHell105",
+        "Hell80",
+    ),
+    ".dominoex": (
+        "DominoEX",
+        "DominoEX_Micro",
+        "DominoEX_4",
+        "DominoEX_5",
+        "DominoEX_8",
+        "DominoEX_11",
+        "DominoEX_16",
+        "DominoEX_22",
+        "DominoEX_44",
+        "DominoEX_88",
+    ),
+    ".fsq": ("FSQ", "FSQ_2", "FSQ_3", "FSQ_6"),
+    ".thor": (
+        "Thor",
+        "ThorMicro",
+        "Thor4",
+        "Thor5",
+        "Thor8",
+        "Thor11",
+        "Thor16",
+        "Thor22",
+        "Thor25",
+        "Thor32",
+        "Thor44",
+        "Thor56",
+        "Thor25x4",
+        "Thor50x1",
+        "Thor50x2",
+        "Thor100",
+    ),
+    ".throb": ("Throb", "Throb1", "Throb2", "Throb4", "ThrobX1", "ThrobX2", "ThrobX4"),
+    ".ifkp": ("IFKP", "create_ifkp_modem"),
+    ".scamp": (
+        "SCAMP",
+        "SCAMPFSK",
+        "SCAMPOOK",
+        "SCFSKFST",
+        "SCFSKSLW",
+        "SCOOKSLW",
+        "SCFSKVSL",
+    ),
+    ".navtex": ("NAVTEX", "SITORB"),
+    ".wefax": ("WEFAX", "WEFAX576", "WEFAX288"),
+}
+
+# Map each exported name to its defining module
+_LAZY = {name: module for module, names in _LAZY_MODULES.items() for name in names}
+
+__all__ = [name for names in _LAZY_MODULES.values() for name in names]
+
+
+def __getattr__(name):
+    """Import an exported modem on first access.
+
+    Submodules that have not been imported yet resolve too, as they did
+    when this package imported them eagerly.
+    """
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        try:
+            # Importing a submodule also binds it in this module's globals
+            return importlib.import_module("." + name, __name__)
+        except ModuleNotFoundError as e:
+            # Only a missing submodule means no such attribute; a failing
+            # import inside an existing one propagates
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List exported names, including ones not yet imported."""
+    return sorted(set(globals()) | set(__all__))
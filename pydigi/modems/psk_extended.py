@@ -226,13 +226,12 @@ class PSK63F(Modem):
 
         varicode = encode_char(char_code)
 
-        # Encode each bit with FEC and transmit
-        for bit_char in varicode:
-            bit = int(bit_char)
-
-            # Encode bit through convolutional encoder (1 bit in, 2 bits out)
-            encoded_bits = self._encoder.encode(bit)
+        # Encode the character's bits through the convolutional encoder
+        # (1 bit in, 2 bits out) in one pass
+        encoded = self._encoder.encode_array([int(bit_char) for bit_char in varicode])
 
+        # Transmit each encoded symbol
+        for encoded_bits in encoded:
             # Transmit both output bits (low bit first)
             bit0 = encoded_bits & 1
             bit1 = (encoded_bits >> 1) & 1
@@ -1164,13 +1163,12 @@ class MultiCarrierPSKR(Modem):
 
         varicode = encode_char(char_code)
 
-        # Encode each bit with FEC, interleave, and transmit
-        for bit_char in varicode:
-            bit = int(bit_char)
-
-            # Encode bit through convolutional encoder (1 bit in, 2 bits out)
-            encoded_bits = self._encoder.encode(bit)
+        # Encode the character's bits through the convolutional encoder
+        # (1 bit in, 2 bits out) in one pass
+        encoded = self._encoder.encode_array([int(bit_char) for bit_char in varicode])
 
+        # Interleave and transmit each encoded symbol
+        for encoded_bits in encoded:
             # Create 2-symbol array for interleaver
             symbols = np.array([encoded_bits & 1, (encoded_bits >> 1) & 1], dtype=np.uint8)
 
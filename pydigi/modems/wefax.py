@@ -16,11 +16,174 @@ Reference: fldigi/src/wefax/wefax.cxx
 
 import numpy as np
 import math
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Optional, Tuple, Union
 from pathlib import Path
 from .base import Modem
 
 
+@lru_cache(maxsize=4)
+def _sine_table(size: int) -> np.ndarray:
+    """
+    Build a read-only sine lookup table, shared by all WEFAX instances.
+
+    Args:
+        size: Number of table entries
+
+    Returns:
+        One full sine period sampled at `size` points
+    """
+    table = np.sin(2.0 * np.pi * np.arange(size) / size)
+    table.setflags(write=False)
+    return table
+
+
+# _synthesize_fm() restarts its running phase sum this often (in samples)
+_FM_CHUNK = 1024
+
+
+def _synthesize_fm(
+    sample_freqs: np.ndarray, sample_rate: float, table_size: int, start_phase: float
+) -> Tuple[np.ndarray, float]:
+    """
+    Generate FM audio for a per-sample frequency sequence.
+
+    Vectorized equivalent of fldigi's phase accumulator loop: the phase of
+    every sample is the running sum of the per-sample phase increments, and
+    the audio is read from the sine lookup table at that phase.
+
+    Args:
+        sample_freqs: Instantaneous frequency of every output sample in Hz
+        sample_rate: Sample rate in Hz
+        table_size: Sine lookup table size
+        start_phase: Phase accumulator value at the first sample
+
+    Returns:
+        Tuple of (audio samples, phase accumulator after the last sample)
+    """
+    if len(sample_freqs) == 0:
+        return np.zeros(0, dtype=np.float64), start_phase
+
+    phase_increments = table_size * sample_freqs / sample_rate
+
+    # Phase before each sample: start phase plus all previous increments.
+    # An unwrapped running sum over a whole image grows large enough for its
+    # rounding error to reach several table steps, so the sum is restarted
+    # from the wrapped phase every _FM_CHUNK samples, keeping it bounded
+    # like fldigi's accumulator.
+    phases = np.empty(len(phase_increments), dtype=np.float64)
+    phase = start_phase
+    for first in range(0, len(phase_increments), _FM_CHUNK):
+        increments = phase_increments[first : first + _FM_CHUNK]
+        chunk = phases[first : first + _FM_CHUNK]
+        chunk[0] = phase
+        np.cumsum(increments[:-1], out=chunk[1:])
+        chunk[1:] += phase
+        phase = (chunk[-1] + increments[-1]) % table_size
+    end_phase = float(phase)
+
+    np.mod(phases, table_size, out=phases)
+    table_idx = phases.astype(np.intp) % table_size
+    return _sine_table(table_size)[table_idx], end_phase
+
+
+@lru_cache(maxsize=8)
+def _scanline_pixel_indices(img_width: int, samples_per_line: int) -> np.ndarray:
+    """
+    Map each audio sample of a scanline to its image pixel (nearest-neighbor).
+
+    Args:
+        img_width: Scanline width in pixels
+        samples_per_line: Number of audio samples per scanline
+
+    Returns:
+        Read-only array of pixel indices, one per audio sample
+    """
+    ratio = img_width / samples_per_line
+    indices = (np.arange(samples_per_line) * ratio).astype(np.intp)
+    np.minimum(indices, img_width - 1, out=indices)
+    indices.setflags(write=False)
+    return indices
+
+
+@lru_cache(maxsize=16)
+def _render_tone(
+    frequency: float, n_samples: int, sample_rate: float, table_size: int, start_phase: float
+) -> Tuple[np.ndarray, float]:
+    """
+    Render a constant-frequency FM tone, memoized on all of its inputs.
+
+    The fixed parts of a transmission (APT START/STOP, BLACK) only depend
+    on these parameters and the phase they start from. APT START always
+    begins from the phase reset by tx_init(), so it is rendered once and
+    reused by every later transmission with the same settings.
+
+    Args:
+        frequency: Tone frequency in Hz
+        n_samples: Number of samples to generate
+        sample_rate: Sample rate in Hz
+        table_size: Sine lookup table size
+        start_phase: Phase accumulator value at the first sample
+
+    Returns:
+        Tuple of (read-only audio samples, phase accumulator after the tone)
+    """
+    sample_freqs = np.full(n_samples, frequency, dtype=np.float64)
+    samples, phase = _synthesize_fm(sample_freqs, sample_rate, table_size, start_phase)
+    samples.setflags(write=False)
+    return samples, phase
+
+
+@lru_cache(maxsize=16)
+def _render_phasing(
+    white_freq: float,
+    black_freq: float,
+    samples_per_line: int,
+    phasing_lines: int,
+    phase_inverted: bool,
+    sample_rate: float,
+    table_size: int,
+    start_phase: float,
+) -> Tuple[np.ndarray, float]:
+    """
+    Render the phasing lines plus ENDPHASING, memoized on all of its inputs.
+
+    Phasing directly follows APT START, so for repeated transmissions it
+    starts from the same phase and is rendered only once.
+
+    Args:
+        white_freq: FM frequency of a white pixel in Hz
+        black_freq: FM frequency of a black pixel in Hz
+        samples_per_line: Number of samples per scanline
+        phasing_lines: Number of phasing lines
+        phase_inverted: Invert phasing pattern black/white
+        sample_rate: Sample rate in Hz
+        table_size: Sine lookup table size
+        start_phase: Phase accumulator value at the first sample
+
+    Returns:
+        Tuple of (read-only audio samples, phase accumulator after ENDPHASING)
+    """
+    # Pattern within one line: white at both edges, black in between
+    phase_pos = np.arange(samples_per_line) / samples_per_line
+    is_white = (phase_pos < 0.025) | (phase_pos >= 0.975)
+
+    # Apply phase inversion if configured
+    if phase_inverted:
+        is_white = ~is_white
+    line_freqs = np.where(is_white, white_freq, black_freq)
+
+    # ENDPHASING line (one full line of white, or black if inverted)
+    endphasing_freq = black_freq if phase_inverted else white_freq
+
+    sample_freqs = np.concatenate(
+        [np.tile(line_freqs, phasing_lines), np.full(samples_per_line, endphasing_freq)]
+    )
+    audio, phase = _synthesize_fm(sample_freqs, sample_rate, table_size, start_phase)
+    audio.setflags(write=False)
+    return audio, phase
+
+
 class WEFAX(Modem):
     """
     WEFAX (Weather Facsimile) modem for image and text transmission.
@@ -165,12 +328,11 @@ class WEFAX(Modem):
         """
         Initialize sine lookup table for fast tone generation.
 
-        Uses an 8192-element table (like fldigi) for performance.
+        Uses an 8192-element table (like fldigi) for performance. The table
+        is built once per size and shared between modem instances.
         """
         if self.sine_table is None:
-            self.sine_table = np.sin(
-                2.0 * np.pi * np.arange(self.sine_table_size) / self.sine_table_size
-            )
+            self.sine_table = _sine_table(self.sine_table_size)
 
     def _pixel_to_frequency(self, pixel_value: float) -> float:
         """
@@ -196,10 +358,31 @@ class WEFAX(Modem):
         frequency = self.carrier + 2.0 * (normalized - 0.5) * self.fm_deviation
         return frequency
 
+    def _pixels_to_frequencies(self, pixels: np.ndarray) -> np.ndarray:
+        """
+        Convert an array of pixel values to FM frequencies in one pass.
+
+        Vectorized form of _pixel_to_frequency(), with the affine map folded
+        into a single scale and bias:
+        frequency = pixel * (2 * fm_deviation / 256) + (carrier - fm_deviation)
+
+        Args:
+            pixels: Pixel values in range 0-255 (any shape)
+
+        Returns:
+            Frequencies in Hz as float64 array with the same shape
+        """
+        scale = 2.0 * self.fm_deviation / 256.0
+        bias = self.carrier - self.fm_deviation
+        return pixels.astype(np.float64) * scale + bias
+
     def _generate_tone(self, frequency: float, n_samples: int) -> np.ndarray:
         """
         Generate FM tone at specified frequency using sine lookup table.
 
+        Tones are memoized (see _render_tone()), so the returned array is
+        read-only and may be shared with other transmissions.
+
         Args:
             frequency: Frequency in Hz
             n_samples: Number of samples to generate
@@ -207,21 +390,13 @@ class WEFAX(Modem):
         Returns:
             Audio samples for the tone
         """
-        samples = np.zeros(n_samples, dtype=np.float64)
-
-        # Calculate phase increment per sample
-        phase_increment = self.sine_table_size * frequency / self.sample_rate
-
-        for i in range(n_samples):
-            # Get sample from lookup table using linear interpolation
-            table_idx = int(self.phase_accumulator) % self.sine_table_size
-            samples[i] = self.sine_table[table_idx]
-
-            # Advance phase
-            self.phase_accumulator += phase_increment
-            if self.phase_accumulator >= self.sine_table_size:
-                self.phase_accumulator -= self.sine_table_size
-
+        samples, self.phase_accumulator = _render_tone(
+            float(frequency),
+            n_samples,
+            float(self.sample_rate),
+            self.sine_table_size,
+            self.phase_accumulator,
+        )
         return samples
 
     def _generate_apt_tone(self, apt_frequency: float, duration: float) -> np.ndarray:
@@ -288,97 +463,44 @@ class WEFAX(Modem):
             Audio samples for phasing pattern including ENDPHASING
         """
         samples_per_line = self._calculate_samples_per_line(lpm)
-        # Add 1 extra line for ENDPHASING
-        total_samples = samples_per_line * (self.phasing_lines + 1)
-        audio = np.zeros(total_samples, dtype=np.float64)
-
-        sample_idx = 0
-        # Generate the 20 phasing lines
-        for line in range(self.phasing_lines):
-            for i in range(samples_per_line):
-                # Calculate position within line (0.0 to 1.0)
-                phase_pos = i / samples_per_line
-
-                # Determine if this should be white or black
-                is_white = (phase_pos < 0.025) or (phase_pos >= 0.975)
-
-                # Apply phase inversion if configured
-                if self.phase_inverted:
-                    is_white = not is_white
-
-                # Convert to pixel value
-                pixel = 255 if is_white else 0
-
-                # Generate tone at pixel frequency
-                freq = self._pixel_to_frequency(pixel)
-                table_idx = int(self.phase_accumulator) % self.sine_table_size
-                audio[sample_idx] = self.sine_table[table_idx]
-
-                # Advance phase
-                phase_increment = self.sine_table_size * freq / self.sample_rate
-                self.phase_accumulator += phase_increment
-                if self.phase_accumulator >= self.sine_table_size:
-                    self.phase_accumulator -= self.sine_table_size
-
-                sample_idx += 1
-
-        # Generate ENDPHASING line (one full line of white, or black if inverted)
-        endphasing_pixel = 0 if self.phase_inverted else 255
-        endphasing_freq = self._pixel_to_frequency(endphasing_pixel)
-        for i in range(samples_per_line):
-            table_idx = int(self.phase_accumulator) % self.sine_table_size
-            audio[sample_idx] = self.sine_table[table_idx]
-
-            # Advance phase
-            phase_increment = self.sine_table_size * endphasing_freq / self.sample_rate
-            self.phase_accumulator += phase_increment
-            if self.phase_accumulator >= self.sine_table_size:
-                self.phase_accumulator -= self.sine_table_size
-
-            sample_idx += 1
-
+        audio, self.phase_accumulator = _render_phasing(
+            float(self._pixel_to_frequency(255)),
+            float(self._pixel_to_frequency(0)),
+            samples_per_line,
+            self.phasing_lines,
+            self.phase_inverted,
+            float(self.sample_rate),
+            self.sine_table_size,
+            self.phase_accumulator,
+        )
         return audio
 
-    def _transmit_scanline(self, scanline: np.ndarray, samples_per_line: int) -> np.ndarray:
+    def _transmit_image_data(self, freqs: np.ndarray, samples_per_line: int) -> np.ndarray:
         """
-        Transmit one image scanline.
+        Transmit all image scanlines in one call.
 
-        Converts pixel values to frequencies and generates FM-modulated audio.
-        Uses nearest-neighbor resampling (matches fldigi implementation).
+        Generates FM-modulated audio from the image's pixel frequencies.
+        Uses nearest-neighbor resampling (matches fldigi implementation):
+        the sample-to-pixel index map is the same for every scanline, so it
+        is computed once and applied to the whole image.
 
         Args:
-            scanline: Image row as 1D numpy array of pixel values (0-255)
-            samples_per_line: Number of audio samples to generate for this line
+            freqs: Image as 2D numpy array (H, W) of pixel frequencies in Hz
+                (see _pixels_to_frequencies())
+            samples_per_line: Number of audio samples to generate per scanline
 
         Returns:
-            Audio samples for this scanline
+            Audio samples for all scanlines
         """
-        audio = np.zeros(samples_per_line, dtype=np.float64)
-        img_width = len(scanline)
-
-        # Calculate ratio for resampling scanline to audio samples
-        ratio = img_width / samples_per_line
+        img_width = freqs.shape[1]
+        pixel_indices = _scanline_pixel_indices(img_width, samples_per_line)
 
-        for i in range(samples_per_line):
-            # Map audio sample index to image pixel index (nearest-neighbor)
-            pixel_idx = int(i * ratio)
-            if pixel_idx >= img_width:
-                pixel_idx = img_width - 1
-
-            # Get pixel value and convert to frequency
-            pixel = scanline[pixel_idx]
-            freq = self._pixel_to_frequency(pixel)
-
-            # Generate sample from lookup table
-            table_idx = int(self.phase_accumulator) % self.sine_table_size
-            audio[i] = self.sine_table[table_idx]
-
-            # Advance phase
-            phase_increment = self.sine_table_size * freq / self.sample_rate
-            self.phase_accumulator += phase_increment
-            if self.phase_accumulator >= self.sine_table_size:
-                self.phase_accumulator -= self.sine_table_size
+        # Frequency of every output sample, scanline after scanline
+        sample_freqs = np.ascontiguousarray(freqs[:, pixel_indices]).ravel()
 
+        audio, self.phase_accumulator = _synthesize_fm(
+            sample_freqs, self.sample_rate, self.sine_table_size, self.phase_accumulator
+        )
         return audio
 
     def _generate_black(self, duration: float) -> np.ndarray:
@@ -651,12 +773,10 @@ class WEFAX(Modem):
             phasing = self._generate_phasing(lpm)
             audio_parts.append(phasing)
 
-        # 3. IMAGE DATA - transmit scanline by scanline
-        img_height = img.shape[0]
-        for row_idx in range(img_height):
-            scanline = img[row_idx, :]
-            scanline_audio = self._transmit_scanline(scanline, samples_per_line)
-            audio_parts.append(scanline_audio)
+        # 3. IMAGE DATA - all scanlines in one pass
+        # Map every pixel to its FM frequency once for the whole image
+        freqs = self._pixels_to_frequencies(np.ascontiguousarray(img))
+        audio_parts.append(self._transmit_image_data(freqs, samples_per_line))
 
         # 4. APT STOP tone
         if include_apt_stop:
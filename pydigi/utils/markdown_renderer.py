@@ -17,6 +17,8 @@ from typing import List, Optional, Tuple, Dict
 from enum import Enum
 import numpy as np
 
+from .text_renderer import _truetype
+
 
 # Page dimensions in inches
 LETTER_WIDTH_INCHES = 8.5
@@ -178,11 +180,11 @@ def _load_fonts(base_font_size: int) -> Dict[TextStyle, any]:
     for style in TextStyle:
         try:
             font_path = _get_bundled_font_path(style)
-            fonts[style] = ImageFont.truetype(font_path, base_font_size)
+            fonts[style] = _truetype(font_path, base_font_size)
         except (OSError, IOError) as e:
             warnings.warn(f"Could not load font for {style.value}: {e}. Using normal font.")
             font_path = _get_bundled_font_path(TextStyle.NORMAL)
-            fonts[style] = ImageFont.truetype(font_path, base_font_size)
+            fonts[style] = _truetype(font_path, base_font_size)
 
     return fonts
 
@@ -401,10 +403,9 @@ def _render_elements_to_pages(
             # Render header with larger font (headers are always bold by default)
             header_font_size = base_font_size + (6 - element.level) * 4
             try:
-                from PIL import ImageFont
-                header_font_bold = ImageFont.truetype(_get_bundled_font_path(TextStyle.BOLD), header_font_size)
-                header_font_normal = ImageFont.truetype(_get_bundled_font_path(TextStyle.NORMAL), header_font_size)
-                header_font_code = ImageFont.truetype(_get_bundled_font_path(TextStyle.CODE), int(header_font_size * 0.9))
+                header_font_bold = _truetype(_get_bundled_font_path(TextStyle.BOLD), header_font_size)
+                header_font_normal = _truetype(_get_bundled_font_path(TextStyle.NORMAL), header_font_size)
+                header_font_code = _truetype(_get_bundled_font_path(TextStyle.CODE), int(header_font_size * 0.9))
             except:
                 header_font_bold = fonts[TextStyle.BOLD]
                 header_font_normal = fonts[TextStyle.NORMAL]
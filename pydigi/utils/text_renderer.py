@@ -10,6 +10,7 @@ page formatting with configurable margins.
 
 import os
 import warnings
+from functools import lru_cache
 from typing import List, Optional, Tuple
 import numpy as np
 
@@ -34,6 +35,27 @@ def _get_bundled_font_path() -> str:
     return os.path.abspath(font_path)
 
 
+@lru_cache(maxsize=32)
+def _truetype(font_path: str, font_size: int):
+    """
+    Load a TrueType font, memoized on (path, size).
+
+    Parsing the TTF tables is comparatively slow, and repeated renders (and
+    the bold/italic variants used by the markdown renderer) reuse the same
+    handful of fonts. Failed loads raise and are therefore not cached.
+
+    Args:
+        font_path: Path to the .ttf file
+        font_size: Font size in points
+
+    Returns:
+        PIL ImageFont.FreeTypeFont object
+    """
+    from PIL import ImageFont
+
+    return ImageFont.truetype(font_path, font_size)
+
+
 def _calculate_horizontal_dpi(image_width: int) -> int:
     """
     Calculate horizontal DPI based on image width and letter page width.
@@ -141,7 +163,7 @@ def _load_font(font_size: int, font_path: Optional[str] = None):
     # Try user-specified font first
     if font_path is not None:
         try:
-            font = ImageFont.truetype(font_path, font_size)
+            font = _truetype(font_path, font_size)
             return font
         except (OSError, IOError) as e:
             warnings.warn(f"Could not load font from {font_path}: {e}. Trying bundled font.")
@@ -149,7 +171,7 @@ def _load_font(font_size: int, font_path: Optional[str] = None):
     # Try bundled font
     bundled_font_path = _get_bundled_font_path()
     try:
-        font = ImageFont.truetype(bundled_font_path, font_size)
+        font = _truetype(bundled_font_path, font_size)
         return font
     except (OSError, IOError) as e:
         warnings.warn(